@@ -6,6 +6,7 @@ This allows testing without requiring actual TIGER/Line shapefiles.
 
 import geopandas as gpd
 from shapely.geometry import Polygon, LineString
+from src.data.masjids import build_masjid_gdf
 from src.rendering.map_renderer import USMapRenderer
 from src.export.exporters import MapExporter
 
@@ -76,13 +77,7 @@ def create_mock_masjids():
         {"name": "Coastal Masjid Al-Noor", "latitude": 40.0, "longitude": -85.0},
     ]
 
-    return gpd.GeoDataFrame(
-        masjids,
-        geometry=gpd.points_from_xy(
-            [m["longitude"] for m in masjids], [m["latitude"] for m in masjids]
-        ),
-        crs="EPSG:4326",
-    )
+    return build_masjid_gdf(masjids)
 
 
 def main():
@@ -2,8 +2,10 @@
 """Download TIGER/Line shapefiles for the Southern California map generator."""
 
 import os
+import shutil
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # TIGER/Line 2023 download URLs
@@ -13,22 +15,64 @@ DOWNLOADS = {
         "filename": "tl_2023_us_county.zip"
     },
     "highways": {
-        "url": "https://www2.census.gov/geo/tiger/TIGER2023/PRIMARYROADS/tl_2023_us_primaryroads.zip", 
+        "url": "https://www2.census.gov/geo/tiger/TIGER2023/PRIMARYROADS/tl_2023_us_primaryroads.zip",
         "filename": "tl_2023_us_primaryroads.zip"
     }
 }
 
+# Number of byte ranges fetched concurrently per file
+RANGE_CHUNKS = 8
+
+
+def fetch_range(url, filename, start, end):
+    """Download bytes start..end of a URL into the same offset of a file."""
+    request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+    with urllib.request.urlopen(request) as response:
+        if response.status != 206:
+            raise IOError(f"Server ignored range request for {filename}")
+        with open(filename, "r+b") as f:
+            f.seek(start)
+            shutil.copyfileobj(response, f)
+
+
+def download_ranges(url, filename, size):
+    """Download a file as RANGE_CHUNKS byte ranges fetched in parallel."""
+    # Preallocate the file so each range can be written at its offset
+    with open(filename, "wb") as f:
+        f.truncate(size)
+    step = -(-size // RANGE_CHUNKS)
+    ranges = [
+        (start, min(start + step, size) - 1) for start in range(0, size, step)
+    ]
+    with ThreadPoolExecutor(max_workers=RANGE_CHUNKS) as executor:
+        list(executor.map(lambda r: fetch_range(url, filename, *r), ranges))
+
+
 def download_file(url, filename):
-    """Download a file with progress indication."""
+    """Download a file, fetching byte ranges in parallel when supported."""
     print(f"Downloading {filename}...")
     try:
-        urllib.request.urlretrieve(url, filename)
+        head = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(head) as response:
+            size = int(response.headers.get("Content-Length", 0))
+            accepts_ranges = response.headers.get("Accept-Ranges") == "bytes"
+
+        if accepts_ranges and size:
+            try:
+                download_ranges(url, filename, size)
+            except OSError as e:
+                # Servers may advertise ranges and still answer 200 (or fail)
+                print(f"Ranged download of {filename} failed ({e}), retrying...")
+                urllib.request.urlretrieve(url, filename)
+        else:
+            urllib.request.urlretrieve(url, filename)
         print(f"✅ Downloaded {filename}")
         return True
     except Exception as e:
         print(f"❌ Failed to download {filename}: {e}")
         return False
 
+
 def extract_zip(zip_path, extract_to):
     """Extract a zip file."""
     print(f"Extracting {zip_path}...")
@@ -41,37 +85,44 @@ def extract_zip(zip_path, extract_to):
         print(f"❌ Failed to extract {zip_path}: {e}")
         return False
 
+
+def download_and_extract(info):
+    """Download one archive, extract it and remove the zip."""
+    filename = info["filename"]
+
+    # Download file
+    if not download_file(info["url"], filename):
+        return False
+
+    # Extract file
+    if not extract_zip(filename, "."):
+        print(f"⚠️  Keeping {filename} due to extraction failure")
+        return False
+
+    # Remove zip file
+    os.remove(filename)
+    print(f"🗑️  Removed {filename}")
+    return True
+
+
 def main():
     """Download and extract TIGER/Line shapefiles."""
     print("🗺️  TIGER/Line Shapefile Downloader")
     print("=" * 40)
-    
+
     # Create data directory
     data_dir = Path("data/shapefiles")
     data_dir.mkdir(parents=True, exist_ok=True)
-    
+
     # Change to data directory
     os.chdir(data_dir)
-    
-    success_count = 0
-    
-    for name, info in DOWNLOADS.items():
-        url = info["url"]
-        filename = info["filename"]
-        
-        # Download file
-        if download_file(url, filename):
-            # Extract file
-            if extract_zip(filename, "."):
-                # Remove zip file
-                os.remove(filename)
-                print(f"🗑️  Removed {filename}")
-                success_count += 1
-            else:
-                print(f"⚠️  Keeping {filename} due to extraction failure")
-        
-        print()
-    
+
+    # Download and extract both archives concurrently
+    with ThreadPoolExecutor(max_workers=len(DOWNLOADS)) as executor:
+        results = list(executor.map(download_and_extract, DOWNLOADS.values()))
+    success_count = sum(results)
+
+    print()
     if success_count == len(DOWNLOADS):
         print("🎉 All shapefiles downloaded and extracted successfully!")
         print("\nYou can now run: python socal_map.py")
@@ -79,5 +130,6 @@ def main():
         print(f"⚠️  {success_count}/{len(DOWNLOADS)} downloads successful")
         print("Please check your internet connection and try again.")
 
+
 if __name__ == "__main__":
     main()
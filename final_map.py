@@ -1,9 +1,39 @@
 #!/usr/bin/env python3
 """Generate the final high-resolution US Masjid Map for 4ft x 4ft printing."""
 
+import importlib.util
+
 import geopandas as gpd
 import matplotlib.pyplot as plt
+from matplotlib.transforms import offset_copy
 import numpy as np
+from PIL import Image
+
+from src.data.cache import load_or_cache
+from src.data.loaders import ensure_display_crs
+from src.data.masjids import MASJID_COORDS, MASJIDS_GDF
+from src.export.exporters import render_tight_rgba
+from src.processing.geometry import (
+    render_tolerance,
+    select_in_extent,
+    simplify_geometries,
+)
+from src.rendering.collections import (
+    build_line_collection,
+    build_polygon_collection,
+)
+from src.rendering.colors import blend_alpha
+
+try:
+    import pyogrio  # noqa: F401
+except ImportError:  # fall back to the slower Fiona reader
+    READ_OPTIONS = {"engine": "fiona"}
+else:
+    gpd.options.io_engine = "pyogrio"
+    READ_OPTIONS = {
+        "engine": "pyogrio",
+        "use_arrow": importlib.util.find_spec("pyarrow") is not None,
+    }
 
 # Final print configuration
 MAP_WIDTH_INCHES = 48  # 4 feet
@@ -21,19 +51,35 @@ HIGHWAY_WIDTH = 1.0
 MASJID_COLOR = "#228B22"
 MASJID_SIZE = 150
 
-# Sample masjid data
-MASJIDS = [
-    {"name": "Islamic Center of Greater Cincinnati", "latitude": 39.1031, "longitude": -84.5120},
-    {"name": "Masjid Al-Noor NYC", "latitude": 40.7128, "longitude": -74.0060},
-    {"name": "Islamic Society of Boston", "latitude": 42.3601, "longitude": -71.0589},
-    {"name": "Dar Al-Hijrah VA", "latitude": 38.9072, "longitude": -77.0369},
-    {"name": "ICSC Los Angeles", "latitude": 34.0522, "longitude": -118.2437},
-    {"name": "Masjid Al-Farah Chicago", "latitude": 41.8781, "longitude": -87.6298},
-    {"name": "Islamic Center of Nashville", "latitude": 36.1627, "longitude": -86.7816},
-    {"name": "Masjid Al-Islam Phoenix", "latitude": 33.4484, "longitude": -112.0740},
-    {"name": "Islamic Center of Detroit", "latitude": 42.3314, "longitude": -83.0458},
-    {"name": "Masjid Al-Taqwa Houston", "latitude": 29.7604, "longitude": -95.3698},
-]
+# Opaque RGBA lookups that look like the layers drawn at alpha 0.8, so Agg
+# fills them without per-pixel blending. Counties sit on white; highways sit
+# on the average county color.
+LAYER_ALPHA = 0.8
+COUNTY_PALETTE = blend_alpha(COUNTY_COLORS, LAYER_ALPHA)
+COUNTY_EDGE_RGBA = blend_alpha([COUNTY_EDGE_COLOR], LAYER_ALPHA)[0]
+HIGHWAY_RGBA = blend_alpha(
+    [HIGHWAY_COLOR], LAYER_ALPHA, background=COUNTY_PALETTE.mean(axis=0)
+)[0]
+
+# Continental US extent (minx, miny, maxx, maxy), in degrees
+CONUS_BBOX = (-130, 20, -65, 50)
+
+
+def layer_cache_path(layer):
+    """Return the GeoParquet cache path for a layer prepared at this output size."""
+    return f"data/cache/{layer}_{MAP_WIDTH_INCHES}in_{PRINT_DPI}dpi.parquet"
+
+
+def prepare_layer(gdf):
+    """Clip a layer to the continental US, normalize its CRS and simplify it."""
+    # Drop Alaska, Hawaii and the territories before they reach the renderer
+    gdf = ensure_display_crs(select_in_extent(gdf, CONUS_BBOX))
+
+    # Drop vertices that would land within half a pixel of each other
+    minx, _, maxx, _ = CONUS_BBOX
+    tolerance = render_tolerance(maxx - minx, MAP_WIDTH_INCHES, PRINT_DPI)
+    return simplify_geometries(gdf, tolerance)
+
 
 def main():
     print("🖨️  Final High-Resolution US Masjid Map Generator")
@@ -44,27 +90,30 @@ def main():
     try:
         # Load real shapefiles
         print("\nLoading shapefiles...")
-        counties = gpd.read_file("data/shapefiles/tl_2023_us_county.shp")
+        counties = load_or_cache(
+            "data/shapefiles/tl_2023_us_county.shp",
+            layer_cache_path("counties"),
+            prepare_layer,
+            columns=["STATEFP"],
+            bbox=CONUS_BBOX,
+            **READ_OPTIONS,
+        )
         print(f"  ✅ Loaded {len(counties)} counties")
         
-        highways = gpd.read_file("data/shapefiles/tl_2023_us_primaryroads.shp")
+        highways = load_or_cache(
+            "data/shapefiles/tl_2023_us_primaryroads.shp",
+            layer_cache_path("highways"),
+            prepare_layer,
+            columns=["RTTYP"],
+            bbox=CONUS_BBOX,
+            **READ_OPTIONS,
+        )
         print(f"  ✅ Loaded {len(highways)} highway segments")
         
-        # Create masjid GeoDataFrame
-        masjids = gpd.GeoDataFrame(
-            MASJIDS,
-            geometry=gpd.points_from_xy([m['longitude'] for m in MASJIDS], 
-                                       [m['latitude'] for m in MASJIDS]),
-            crs='EPSG:4326'
-        )
-        print(f"  ✅ Created {len(masjids)} masjid points")
+        masjids = MASJIDS_GDF
+        print(f"  ✅ Using {len(masjids)} masjid points")
         
-        # Ensure consistent CRS
-        print("Ensuring consistent coordinate systems...")
-        if counties.crs != 'EPSG:4326':
-            counties = counties.to_crs('EPSG:4326')
-        if highways.crs != 'EPSG:4326':
-            highways = highways.to_crs('EPSG:4326')
+        minx, miny, maxx, maxy = CONUS_BBOX
         
         print("\\n🎨 Rendering final high-resolution map...")
         print("⚠️  This will take several minutes and use significant memory...")
@@ -73,58 +122,67 @@ def main():
         fig, ax = plt.subplots(figsize=(MAP_WIDTH_INCHES, MAP_HEIGHT_INCHES), dpi=PRINT_DPI)
         ax.set_aspect('equal')
         ax.axis('off')
-        plt.tight_layout(pad=0)
+        # Fixed layout so the PNG can be written from a single draw pass
+        fig.subplots_adjust(left=0, right=1, top=0.95, bottom=0)
         
         # Set extent for continental US
-        ax.set_xlim(-130, -65)
-        ax.set_ylim(20, 50)
+        ax.set_xlim(minx, maxx)
+        ax.set_ylim(miny, maxy)
         
         # Render counties
         print("  🏞️  Rendering counties...")
         n_counties = len(counties)
-        np.random.seed(42)  # Consistent colors
-        color_indices = np.random.choice(len(COUNTY_COLORS), n_counties)
-        colors = [COUNTY_COLORS[i] for i in color_indices]
-        
-        counties.plot(
-            ax=ax,
-            color=colors,
-            edgecolor=COUNTY_EDGE_COLOR,
-            linewidth=COUNTY_EDGE_WIDTH,
-            alpha=0.8
+        rng = np.random.default_rng(42)  # Consistent colors
+        color_indices = rng.integers(
+            0, len(COUNTY_COLORS), size=n_counties, dtype=np.int8
         )
         
+        county_polygons = build_polygon_collection(
+            counties.geometry.values,
+            facecolors=COUNTY_PALETTE[color_indices],
+            edgecolors=COUNTY_EDGE_RGBA,
+            linewidths=COUNTY_EDGE_WIDTH,
+            rasterized=True,  # Embed as one raster layer in the PDF
+        )
+        ax.add_collection(county_polygons, autolim=False)
+        
         # Render highways
         print("  🛣️  Rendering highways...")
-        highways.plot(
-            ax=ax,
-            color=HIGHWAY_COLOR,
-            linewidth=HIGHWAY_WIDTH,
-            alpha=0.8
+        highway_lines = build_line_collection(
+            highways.geometry.values,
+            colors=HIGHWAY_RGBA,
+            linewidths=HIGHWAY_WIDTH,
+            rasterized=True,
         )
+        ax.add_collection(highway_lines, autolim=False)
         
         # Render masjids
         print("  🕌 Rendering masjids...")
-        masjids.plot(
-            ax=ax,
+        masjid_xy = MASJID_COORDS
+        ax.scatter(
+            masjid_xy[:, 0],
+            masjid_xy[:, 1],
             color=MASJID_COLOR,
             marker='*',
-            markersize=MASJID_SIZE,
-            alpha=0.9
+            s=MASJID_SIZE,
+            alpha=0.9,
+            zorder=3
         )
         
-        # Add masjid labels
-        for idx, row in masjids.iterrows():
-            ax.annotate(
-                row['name'],
-                xy=(row.geometry.x, row.geometry.y),
-                xytext=(8, 8),
-                textcoords='offset points',
+        # Add masjid labels, sharing one data-plus-offset transform
+        label_transform = offset_copy(ax.transData, fig=fig, x=8, y=8, units='points')
+        for (x, y), name in zip(masjid_xy, masjids['name'].to_numpy()):
+            ax.text(
+                x,
+                y,
+                name,
+                transform=label_transform,
                 fontsize=12,
                 ha='left',
                 va='bottom',
                 bbox=dict(boxstyle='round,pad=0.5', facecolor='white', alpha=0.8),
-                weight='bold'
+                weight='bold',
+                zorder=3
             )
         
         # Add title
@@ -140,27 +198,31 @@ def main():
         # Export PNG
         print("  📄 Exporting PNG...")
         png_path = "output/us_masjid_map_final.png"
-        fig.savefig(
+        # Crop to the drawn content like bbox_inches='tight', without a second draw
+        pixels, bbox = render_tight_rgba(fig, pad_inches=0.2)
+        
+        # Encode the PNG before the PDF save touches the figure again;
+        # pixels is a view of the live Agg buffer
+        Image.fromarray(pixels).save(
             png_path,
-            format='png',
-            dpi=PRINT_DPI,
-            bbox_inches='tight',
-            pad_inches=0.2,
-            facecolor='white',
-            edgecolor='none'
+            format='PNG',
+            compress_level=1,
+            dpi=(PRINT_DPI, PRINT_DPI)
         )
         
         # Export PDF
         print("  📄 Exporting PDF...")
         pdf_path = "output/us_masjid_map_final.pdf"
-        fig.savefig(
-            pdf_path,
-            format='pdf',
-            bbox_inches='tight',
-            pad_inches=0.2,
-            facecolor='white',
-            edgecolor='none'
-        )
+        # Maximum Flate compression for the embedded layer rasters
+        with plt.rc_context({"pdf.compression": 9}):
+            fig.savefig(
+                pdf_path,
+                format='pdf',
+                dpi=PRINT_DPI,  # Resolution of the rasterized layers
+                bbox_inches=bbox,  # Reuse the PNG crop; skips a measuring draw
+                facecolor='white',
+                edgecolor='none'
+            )
         
         # Get file sizes
         import os
@@ -1,27 +1,30 @@
 #!/usr/bin/env python3
 """Generate the real US Masjid Map with actual TIGER/Line shapefiles."""
 
+import importlib.util
 import sys
 import os
 sys.path.append('src')
 
 import geopandas as gpd
+from data.loaders import ensure_display_crs
+from data.masjids import MASJIDS_GDF
 from rendering.map_renderer import USMapRenderer
 from export.exporters import MapExporter
 
-# Sample masjid data
-MASJIDS = [
-    {"name": "Islamic Center of Greater Cincinnati", "latitude": 39.1031, "longitude": -84.5120},
-    {"name": "Masjid Al-Noor NYC", "latitude": 40.7128, "longitude": -74.0060},
-    {"name": "Islamic Society of Boston", "latitude": 42.3601, "longitude": -71.0589},
-    {"name": "Dar Al-Hijrah VA", "latitude": 38.9072, "longitude": -77.0369},
-    {"name": "ICSC Los Angeles", "latitude": 34.0522, "longitude": -118.2437},
-    {"name": "Masjid Al-Farah Chicago", "latitude": 41.8781, "longitude": -87.6298},
-    {"name": "Islamic Center of Nashville", "latitude": 36.1627, "longitude": -86.7816},
-    {"name": "Masjid Al-Islam Phoenix", "latitude": 33.4484, "longitude": -112.0740},
-    {"name": "Islamic Center of Detroit", "latitude": 42.3314, "longitude": -83.0458},
-    {"name": "Masjid Al-Taqwa Houston", "latitude": 29.7604, "longitude": -95.3698},
-]
+try:
+    import pyogrio  # noqa: F401
+except ImportError:  # fall back to the slower Fiona reader
+    READ_OPTIONS = {"engine": "fiona"}
+else:
+    gpd.options.io_engine = "pyogrio"
+    READ_OPTIONS = {
+        "engine": "pyogrio",
+        "use_arrow": importlib.util.find_spec("pyarrow") is not None,
+    }
+
+# Continental US extent (minx, miny, maxx, maxy), in degrees
+CONUS_BBOX = (-130, 20, -65, 50)
 
 def main():
     print("🗺️  US Masjid Map Generator - Real Data")
@@ -31,27 +34,29 @@ def main():
     print("Loading shapefiles...")
     
     try:
-        counties = gpd.read_file("data/shapefiles/tl_2023_us_county.shp")
+        counties = gpd.read_file(
+            "data/shapefiles/tl_2023_us_county.shp",
+            columns=["STATEFP"],
+            bbox=CONUS_BBOX,
+            **READ_OPTIONS,
+        )
         print(f"  ✅ Loaded {len(counties)} counties")
         
-        highways = gpd.read_file("data/shapefiles/tl_2023_us_primaryroads.shp")
+        highways = gpd.read_file(
+            "data/shapefiles/tl_2023_us_primaryroads.shp",
+            columns=["RTTYP"],
+            bbox=CONUS_BBOX,
+            **READ_OPTIONS,
+        )
         print(f"  ✅ Loaded {len(highways)} highway segments")
         
-        # Create masjid GeoDataFrame
-        masjids = gpd.GeoDataFrame(
-            MASJIDS,
-            geometry=gpd.points_from_xy([m['longitude'] for m in MASJIDS], 
-                                       [m['latitude'] for m in MASJIDS]),
-            crs='EPSG:4326'
-        )
-        print(f"  ✅ Created {len(masjids)} masjid points")
+        masjids = MASJIDS_GDF
+        print(f"  ✅ Using {len(masjids)} masjid points")
         
         # Ensure consistent CRS
         print("Ensuring consistent coordinate systems...")
-        if counties.crs != 'EPSG:4326':
-            counties = counties.to_crs('EPSG:4326')
-        if highways.crs != 'EPSG:4326':
-            highways = highways.to_crs('EPSG:4326')
+        counties = ensure_display_crs(counties)
+        highways = ensure_display_crs(highways)
         
         print("Rendering map (this may take a few minutes)...")
         
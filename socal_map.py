@@ -1,17 +1,33 @@
 #!/usr/bin/env python3
 """Generate clean Southern California map with highway names legend."""
 
-import geopandas as gpd
+import functools
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import os
+import shapely
 from matplotlib.patches import Rectangle
+from matplotlib.transforms import offset_copy
+from PIL import Image
+
+from src.data.loaders import ShapefileLoader, ensure_display_crs
+from src.export.exporters import render_tight_rgba
+from src.processing.geometry import (
+    merge_lines_by_key,
+    render_tolerance,
+    simplify_geometries,
+)
+from src.processing.labels import LabelPlacer, text_box_size
+from src.rendering.collections import build_line_collection
+from src.utils.config import MASJID, TARGET_COUNTIES, TARGET_STATE_FP
 
 # Configuration
 MAP_WIDTH_INCHES = 24
 MAP_HEIGHT_INCHES = 24
 DPI = 300
+PDF_RASTER_DPI = 150  # Only affects the rasterized layers in the PDF
+MAX_PNG_PIXELS = 8000  # Warn when the PNG gets wider or taller than this
 
 # Distinct county colors
 COUNTY_COLORS = {
@@ -62,16 +78,55 @@ HIGHWAY_WIDTH = 2.0
 MASJID_COLOR = "#228B22"  # Green
 MASJID_SIZE = 400
 
-# Target counties
-TARGET_COUNTIES = ["Los Angeles", "Orange", "Riverside", "San Bernardino"]
+# Shared label box styles; highway labels fill theirs with the route color
+COUNTY_LABEL_BBOX = dict(
+    boxstyle="round,pad=0.6", facecolor="white", alpha=0.9, edgecolor="gray"
+)
+HIGHWAY_LABEL_BBOX = dict(boxstyle="round,pad=0.3", alpha=0.9, edgecolor="white")
 
-# Single masjid location
-MASJID = {
-    "name": "Orange County Masjid",
-    "latitude": 34.0633,
-    "longitude": -117.6509,
-    "address": "1027 E Philadelphia St, Ontario, CA 91761",
-}
+# Route types that get highway labels, in placement priority order
+LABEL_ROUTE_PRIORITY = {"I": 0, "U": 1}
+
+EXTENT_BUFFER = 0.05  # Degrees of margin around the target counties
+
+
+def select_highway_columns(highways):
+    """Keep only the highway columns used for drawing and labeling."""
+    highways = highways[["RTTYP", "FULLNAME", "geometry"]].copy()
+    highways["RTTYP"] = highways["RTTYP"].astype("category")
+    return highways
+
+
+@functools.lru_cache(maxsize=1)
+def load_socal_layers():
+    """
+    Load the target counties and the highways around them.
+
+    Layers are read through ShapefileLoader's GeoParquet copies with the
+    county filter and highway bbox pushed into the read, and memoized, so
+    repeated calls in one session (e.g. a notebook re-running main) reuse
+    them. Callers must not modify the returned GeoDataFrames in place.
+    """
+    target_counties = ShapefileLoader.load_counties(
+        state_fp=TARGET_STATE_FP, names=TARGET_COUNTIES, columns=["NAME"]
+    )
+
+    # Read only the highways around the counties
+    minx, miny, maxx, maxy = target_counties.total_bounds
+    regional_highways = select_highway_columns(
+        ShapefileLoader.load_highways(
+            bbox=(
+                minx - EXTENT_BUFFER,
+                miny - EXTENT_BUFFER,
+                maxx + EXTENT_BUFFER,
+                maxy + EXTENT_BUFFER,
+            ),
+            columns=["RTTYP", "FULLNAME"],
+        )
+    )
+
+    # Ensure consistent CRS; NAD83 is relabeled rather than reprojected
+    return ensure_display_crs(target_counties), ensure_display_crs(regional_highways)
 
 
 def add_highway_legend(ax, bounds, labeled_highways, highway_color_map):
@@ -149,63 +204,40 @@ def main():
     try:
         # Load shapefiles
         print("Loading shapefiles...")
-        counties = gpd.read_file("data/shapefiles/tl_2023_us_county.shp")
-        highways = gpd.read_file("data/shapefiles/tl_2023_us_primaryroads.shp")
-
-        # Filter for target counties in California
-        target_counties = counties[
-            (counties["NAME"].isin(TARGET_COUNTIES)) & (counties["STATEFP"] == "06")
-        ].copy()
-
-        print(f"  ✅ Filtered to {len(target_counties)} counties")
-
-        # Get bounds and filter highways
+        target_counties, regional_highways = load_socal_layers()
         bounds = target_counties.total_bounds
-        buffer = 0.05
-
-        # Filter highways to region
-        regional_highways = highways.cx[
-            bounds[0] - buffer : bounds[2] + buffer,
-            bounds[1] - buffer : bounds[3] + buffer,
-        ].copy()
+        buffer = EXTENT_BUFFER
 
-        # Add color column based on route type
-        regional_highways["color"] = (
-            regional_highways["RTTYP"].map(HIGHWAY_COLORS).fillna(HIGHWAY_COLORS["C"])
-        )
+        print(f"  ✅ Filtered to {len(target_counties)} counties")
 
         # Filter for major highways for labeling
-        major_highways_for_labels = regional_highways[
-            (regional_highways["RTTYP"].isin(["I", "U"]))
-            & (regional_highways["FULLNAME"].notna())
-            & (regional_highways["FULLNAME"].str.len() > 0)
+        major_highways_for_labels = regional_highways.loc[
+            regional_highways["RTTYP"].isin(list(LABEL_ROUTE_PRIORITY))
+            & regional_highways["FULLNAME"].fillna("").ne("")
         ].copy()
 
         print(f"  ✅ Using {len(regional_highways)} highway segments")
         print(f"  ✅ Will label {len(major_highways_for_labels)} major highways")
 
-        # Create single masjid GeoDataFrame
-        masjid_gdf = gpd.GeoDataFrame(
-            [MASJID],
-            geometry=gpd.points_from_xy([MASJID["longitude"]], [MASJID["latitude"]]),
-            crs="EPSG:4326",
+        # Drop vertices that would land within half a pixel of each other;
+        # labels keep using the full-resolution geometries
+        tolerance = render_tolerance(
+            bounds[2] - bounds[0] + 2 * buffer, MAP_WIDTH_INCHES, DPI
         )
-
-        # Ensure consistent CRS
-        if target_counties.crs != "EPSG:4326":
-            target_counties = target_counties.to_crs("EPSG:4326")
-        if regional_highways.crs != "EPSG:4326":
-            regional_highways = regional_highways.to_crs("EPSG:4326")
+        drawn_counties = simplify_geometries(target_counties, tolerance)
+        drawn_highways = simplify_geometries(regional_highways, tolerance)
 
         print("Rendering map with highway names legend...")
 
         # Create figure
-        fig, ax = plt.subplots(figsize=(MAP_WIDTH_INCHES, MAP_HEIGHT_INCHES), dpi=DPI)
+        fig, ax = plt.subplots(figsize=(MAP_WIDTH_INCHES, MAP_HEIGHT_INCHES))
         ax.set_aspect("equal")
         ax.axis("off")
         ax.set_facecolor("white")
         fig.patch.set_facecolor("white")
-        plt.tight_layout(pad=0)
+        # Fixed layout leaving room for the title above the axes, so no
+        # layout measuring draw is needed
+        fig.subplots_adjust(left=0, right=1, bottom=0, top=0.95)
 
         # Set extent
         ax.set_xlim(bounds[0] - buffer, bounds[2] + buffer)
@@ -213,128 +245,140 @@ def main():
 
         # Render counties with specific colors
         print("  🏞️  Rendering counties with colors...")
-        for idx, row in target_counties.iterrows():
-            county_name = row["NAME"]
-            color = COUNTY_COLORS.get(county_name, "#F0F0F0")
-
-            gpd.GeoDataFrame([row]).plot(
-                ax=ax,
-                color=color,
-                edgecolor=COUNTY_EDGE_COLOR,
-                linewidth=COUNTY_EDGE_WIDTH,
-                alpha=0.8,
-            )
+        county_colors = drawn_counties["NAME"].map(COUNTY_COLORS).fillna("#F0F0F0")
+        drawn_counties.plot(
+            ax=ax,
+            color=county_colors.tolist(),
+            edgecolor=COUNTY_EDGE_COLOR,
+            linewidth=COUNTY_EDGE_WIDTH,
+            alpha=0.8,
+            rasterized=True,
+        )
 
         # Render highways with unique colors for each highway
         print("  🛣️  Rendering highways with unique colors...")
-        highway_color_map = {}
-        color_index = 0
-
-        # Assign unique colors to each highway name
-        unique_highways = regional_highways["FULLNAME"].dropna().unique()
-        for highway_name in unique_highways:
-            if highway_name and highway_name.strip():
-                highway_color_map[highway_name] = HIGHWAY_UNIQUE_COLORS[
-                    color_index % len(HIGHWAY_UNIQUE_COLORS)
-                ]
-                color_index += 1
-
-        # Render highways grouped by name with unique colors
-        for highway_name, color in highway_color_map.items():
-            highway_segments = regional_highways[
-                regional_highways["FULLNAME"] == highway_name
-            ]
-            if not highway_segments.empty:
-                highway_segments.plot(
-                    ax=ax, color=color, linewidth=HIGHWAY_WIDTH, alpha=0.8
-                )
+        # Assign unique colors to each highway name, cycling the palette
+        highway_names = regional_highways["FULLNAME"].dropna()
+        unique_highways = highway_names[highway_names.str.strip() != ""].unique()
+        palette_index = np.arange(len(unique_highways)) % len(HIGHWAY_UNIQUE_COLORS)
+        highway_color_map = dict(
+            zip(unique_highways, np.asarray(HIGHWAY_UNIQUE_COLORS)[palette_index])
+        )
+
+        # Render all named highways as one collection colored by name, with
+        # each highway's segments coalesced into as few lines as possible
+        named = drawn_highways["FULLNAME"].isin(highway_color_map).to_numpy()
+        merged_highways, merged_names = merge_lines_by_key(
+            drawn_highways.geometry.values[named],
+            drawn_highways["FULLNAME"].to_numpy()[named],
+        )
+        named_highways = build_line_collection(
+            merged_highways,
+            geometry_colors=[highway_color_map[name] for name in merged_names],
+            linewidths=HIGHWAY_WIDTH,
+            alpha=0.8,
+            rasterized=True,
+        )
+        ax.add_collection(named_highways, autolim=False)
 
         # Render highways without names in gray
-        unnamed_highways = regional_highways[
-            (regional_highways["FULLNAME"].isna())
-            | (regional_highways["FULLNAME"].str.strip() == "")
-        ]
-        if not unnamed_highways.empty:
-            unnamed_highways.plot(
-                ax=ax, color="#CCCCCC", linewidth=HIGHWAY_WIDTH * 0.7, alpha=0.5
+        if not named.all():
+            unnamed_highways = build_line_collection(
+                drawn_highways.geometry.values[~named],
+                colors="#CCCCCC",
+                linewidths=HIGHWAY_WIDTH * 0.7,
+                alpha=0.5,
+                rasterized=True,
             )
+            ax.add_collection(unnamed_highways, autolim=False)
+
+        # Track claimed label space in display coordinates
+        ax.apply_aspect()
+        placer = LabelPlacer(ax.bbox.extents)
+        points_to_pixels = fig.dpi / 72
 
         # Add county labels
         print("  🏷️  Adding county labels...")
-        for idx, row in target_counties.iterrows():
-            centroid = row.geometry.centroid
-            ax.annotate(
-                row["NAME"],
-                xy=(centroid.x, centroid.y),
+        centroid_xy = shapely.get_coordinates(
+            shapely.centroid(target_counties.geometry.values)
+        )
+        centroid_px = ax.transData.transform(centroid_xy)
+        for county_name, (x, y), (px, py) in zip(
+            target_counties["NAME"], centroid_xy, centroid_px
+        ):
+            ax.text(
+                x,
+                y,
+                county_name,
                 ha="center",
                 va="center",
                 fontsize=18,
                 weight="bold",
                 color="#333333",
-                bbox=dict(
-                    boxstyle="round,pad=0.6",
-                    facecolor="white",
-                    alpha=0.9,
-                    edgecolor="gray",
-                ),
+                bbox=COUNTY_LABEL_BBOX,
             )
+            width, height = text_box_size(county_name, 18, pad=0.6)
+            placer.claim(px, py, width * points_to_pixels, height * points_to_pixels)
 
-        # Add selective highway labels and collect for legend
+        # Add highway labels where they fit and collect them for the legend
         print("  🛣️  Adding highway labels...")
-        labeled_highways = []
-        labeled_names = set()
+        # Take the longest drawable line of each name, interstates first,
+        # then compute every label's midpoint and angle in one pass
+        label_geoms = major_highways_for_labels.geometry.values
+        drawable = (
+            shapely.get_type_id(label_geoms) == shapely.GeometryType.LINESTRING
+        ) & (shapely.get_num_coordinates(label_geoms) >= 2)
+        candidates = major_highways_for_labels[drawable]
+        longest = (
+            pd.Series(shapely.length(candidates.geometry.values))
+            .groupby(candidates["FULLNAME"].to_numpy(), sort=False)
+            .idxmax()
+        )
+        label_rows = candidates.iloc[longest.to_numpy()]
+        priority = label_rows["RTTYP"].astype(str).map(LABEL_ROUTE_PRIORITY)
+        label_rows = label_rows.iloc[np.argsort(priority.to_numpy(), kind="stable")]
 
-        for idx, row in major_highways_for_labels.iterrows():
-            highway_name = row["FULLNAME"]
+        coords, coord_index = shapely.get_coordinates(
+            label_rows.geometry.values, return_index=True
+        )
+        starts = np.searchsorted(coord_index, np.arange(len(label_rows)))
+        mid_idx = starts + shapely.get_num_coordinates(label_rows.geometry.values) // 2
+        p1 = coords[mid_idx - 1]
+        p2 = coords[mid_idx]
+
+        angles = np.degrees(np.arctan2(p2[:, 1] - p1[:, 1], p2[:, 0] - p1[:, 0]))
+        angles = np.where(angles > 90, angles - 180, angles)
+        angles = np.where(angles < -90, angles + 180, angles)
 
-            if highway_name in labeled_names:
+        labeled_highways = []
+        to_data = ax.transData.inverted()
+        for highway_name, (px, py), angle in zip(
+            label_rows["FULLNAME"], ax.transData.transform(p2), angles
+        ):
+            width, height = text_box_size(highway_name, 10, pad=0.3, rotation=angle)
+            spot = placer.place(
+                px, py, width * points_to_pixels, height * points_to_pixels
+            )
+            if spot is None:
                 continue
 
-            if hasattr(row.geometry, "coords"):
-                coords = list(row.geometry.coords)
-                if len(coords) >= 2:
-                    mid_idx = len(coords) // 2
-                    mid_point = coords[mid_idx]
-
-                    # Calculate angle
-                    if mid_idx > 0:
-                        p1 = coords[mid_idx - 1]
-                        p2 = coords[mid_idx]
-                        angle = np.degrees(np.arctan2(p2[1] - p1[1], p2[0] - p1[0]))
-
-                        if angle > 90:
-                            angle -= 180
-                        elif angle < -90:
-                            angle += 180
-                    else:
-                        angle = 0
-
-                    # Get unique color for this highway
-                    route_color = highway_color_map.get(highway_name, "#666666")
-
-                    ax.annotate(
-                        highway_name,
-                        xy=mid_point,
-                        ha="center",
-                        va="center",
-                        fontsize=10,
-                        weight="bold",
-                        color="white",
-                        rotation=angle,
-                        bbox=dict(
-                            boxstyle="round,pad=0.3",
-                            facecolor=route_color,
-                            alpha=0.9,
-                            edgecolor="white",
-                        ),
-                    )
-
-                    # Add to legend list
-                    labeled_highways.append(highway_name)
-                    labeled_names.add(highway_name)
-
-                    if len(labeled_highways) >= 12:
-                        break
+            # Get unique color for this highway
+            route_color = highway_color_map.get(highway_name, "#666666")
+
+            x, y = to_data.transform(spot)
+            ax.text(
+                x,
+                y,
+                highway_name,
+                ha="center",
+                va="center",
+                fontsize=10,
+                weight="bold",
+                color="white",
+                rotation=angle,
+                bbox={**HIGHWAY_LABEL_BBOX, "facecolor": route_color},
+            )
+            labeled_highways.append(highway_name)
 
         # Add highway legend with actual names and unique colors
         print("  📋 Adding highway names legend...")
@@ -342,22 +386,23 @@ def main():
 
         # Render masjid
         print("  🕌 Rendering masjid...")
-        masjid_gdf.plot(
-            ax=ax,
-            color=MASJID_COLOR,
+        ax.scatter(
+            [MASJID["longitude"]],
+            [MASJID["latitude"]],
+            s=MASJID_SIZE,
+            c=MASJID_COLOR,
             marker="*",
-            markersize=MASJID_SIZE,
             alpha=1.0,
             edgecolors="white",
-            linewidth=3,
+            linewidths=3,
         )
 
         # Add masjid label
-        ax.annotate(
+        ax.text(
+            MASJID["longitude"],
+            MASJID["latitude"],
             f"{MASJID['name']}\n{MASJID['address']}",
-            xy=(MASJID["longitude"], MASJID["latitude"]),
-            xytext=(25, 25),
-            textcoords="offset points",
+            transform=offset_copy(ax.transData, fig=fig, x=25, y=25, units="points"),
             fontsize=14,
             ha="left",
             va="bottom",
@@ -384,15 +429,15 @@ def main():
         print("Exporting maps...")
 
         # Export PNG
+        if max(MAP_WIDTH_INCHES, MAP_HEIGHT_INCHES) * DPI > MAX_PNG_PIXELS:
+            print(f"  ⚠️  PNG exceeds {MAX_PNG_PIXELS} px per side at {DPI} DPI")
         png_path = "output/us_masjid_map_final.png"
-        fig.savefig(
-            png_path,
-            format="png",
-            dpi=DPI,
-            bbox_inches="tight",
-            pad_inches=0.3,
-            facecolor="white",
-            edgecolor="none",
+        # Draw once at the save DPI and encode the cropped Agg buffer with
+        # fast zlib settings, instead of savefig's tight-bbox double draw
+        fig.set_dpi(DPI)
+        pixels, bbox = render_tight_rgba(fig, pad_inches=0.3)
+        Image.fromarray(pixels).save(
+            png_path, format="PNG", compress_level=1, dpi=(DPI, DPI)
         )
 
         # Export PDF
@@ -400,8 +445,8 @@ def main():
         fig.savefig(
             pdf_path,
             format="pdf",
-            bbox_inches="tight",
-            pad_inches=0.3,
+            dpi=PDF_RASTER_DPI,
+            bbox_inches=bbox,  # Reuse the PNG crop; skips a measuring draw
             facecolor="white",
             edgecolor="none",
         )
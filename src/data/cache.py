@@ -0,0 +1,106 @@
+"""GeoParquet caching of preprocessed shapefile layers."""
+
+import importlib.util
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+import geopandas as gpd
+
+PathLike = Union[str, Path]
+
+
+def _can_cache() -> bool:
+    """Return whether GeoParquet can be written in this environment."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _arrow_read_kwargs() -> Dict[str, Any]:
+    """
+    Return ``gpd.read_file`` options for pyogrio's Arrow reader.
+
+    Only used when pyarrow is installed; features then arrive as Arrow
+    columns instead of being built record by record. Empty when pyogrio is
+    missing, so GeoPandas falls back to its default engine.
+    """
+    if importlib.util.find_spec("pyogrio") is None:
+        return {}
+    return {"engine": "pyogrio", "use_arrow": True}
+
+
+def _is_fresh(src_shp: Path, cache_parquet: Path) -> bool:
+    """Return whether the cache exists and is at least as new as the source."""
+    return (
+        cache_parquet.exists()
+        and cache_parquet.stat().st_mtime >= src_shp.stat().st_mtime
+    )
+
+
+def load_or_cache(
+    src_shp: PathLike,
+    cache_parquet: PathLike,
+    preprocess_fn: Optional[Callable[[gpd.GeoDataFrame], gpd.GeoDataFrame]] = None,
+    **read_kwargs: Any,
+) -> gpd.GeoDataFrame:
+    """
+    Load a preprocessed layer from GeoParquet, rebuilding it when stale.
+
+    The cache is used when it exists and is newer than the shapefile.
+    Otherwise the shapefile is read, passed through ``preprocess_fn`` and
+    written to the cache. Caching is skipped when pyarrow is not installed.
+
+    Args:
+        src_shp: Path to the source shapefile
+        cache_parquet: Path to the GeoParquet cache file
+        preprocess_fn: Optional function applied to the freshly read layer
+        **read_kwargs: Extra keyword arguments for ``gpd.read_file``
+
+    Returns:
+        Preprocessed GeoDataFrame
+    """
+    src_shp = Path(src_shp)
+    cache_parquet = Path(cache_parquet)
+    can_cache = _can_cache()
+
+    if can_cache and _is_fresh(src_shp, cache_parquet):
+        return gpd.read_parquet(cache_parquet)
+
+    if can_cache:
+        read_kwargs = {**_arrow_read_kwargs(), **read_kwargs}
+    gdf = gpd.read_file(src_shp, **read_kwargs)
+    if preprocess_fn is not None:
+        gdf = preprocess_fn(gdf)
+
+    if can_cache:
+        cache_parquet.parent.mkdir(parents=True, exist_ok=True)
+        gdf.to_parquet(cache_parquet, compression="zstd")
+
+    return gdf
+
+
+def ensure_parquet(src_shp: PathLike, cache_parquet: PathLike) -> Optional[Path]:
+    """
+    Keep a full GeoParquet copy of a shapefile, rebuilding it when stale.
+
+    The copy is written with a bbox covering column so ``gpd.read_parquet``
+    can skip row groups outside a requested bbox.
+
+    Args:
+        src_shp: Path to the source shapefile
+        cache_parquet: Path to the GeoParquet copy
+
+    Returns:
+        Path to the GeoParquet copy, or None when pyarrow is not installed
+    """
+    src_shp = Path(src_shp)
+    cache_parquet = Path(cache_parquet)
+
+    if not _can_cache():
+        return None
+
+    if not _is_fresh(src_shp, cache_parquet):
+        cache_parquet.parent.mkdir(parents=True, exist_ok=True)
+        gpd.read_file(src_shp, **_arrow_read_kwargs()).to_parquet(
+            cache_parquet, compression="zstd", write_covering_bbox=True
+        )
+
+    return cache_parquet
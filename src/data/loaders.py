@@ -1,23 +1,147 @@
 """Data loading utilities for shapefiles and masjid coordinates."""
 
+import hashlib
 import os
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import IO, Optional, List, Dict, Any, Tuple, Union
 import geopandas as gpd
 import pandas as pd
-from ..utils.config import SHAPEFILES_DIR, COUNTIES_SHAPEFILE, HIGHWAYS_SHAPEFILE
+import shapely
+from .cache import ensure_parquet
+from ..utils.config import (
+    CACHE_DIR,
+    SHAPEFILES_DIR,
+    COUNTIES_SHAPEFILE,
+    HIGHWAYS_SHAPEFILE,
+)
+
+# Subdirectory of CACHE_DIR holding ShapefileLoader's GeoParquet copies; other
+# caches in CACHE_DIR (e.g. load_or_cache layers) are left alone
+SHAPEFILE_CACHE_SUBDIR = "shapefiles"
+
+# EPSG codes indistinguishable from WGS84 at map display scale (NAD83 is ~1 m off)
+DISPLAY_EQUIVALENT_EPSG = {4269, 4326}
 
 
 class ShapefileLoader:
     """Load and validate shapefile data."""
 
     @staticmethod
-    def load_counties(shapefile_path: Optional[str] = None) -> gpd.GeoDataFrame:
+    def clear_cache() -> int:
+        """
+        Delete the GeoParquet copies made by this loader.
+
+        Caches are already rebuilt automatically when a shapefile is newer
+        than its copy; this forces a rebuild, e.g. after changing filters.
+        Only the loader's own cache subdirectory is cleared; other layers
+        cached in CACHE_DIR are kept.
+
+        Returns:
+            Number of cache files removed
+        """
+        cache_dir = Path(CACHE_DIR) / SHAPEFILE_CACHE_SUBDIR
+        cache_files = list(cache_dir.glob("*.parquet"))
+        for cache_file in cache_files:
+            cache_file.unlink()
+
+        return len(cache_files)
+
+    @staticmethod
+    def _ensure_parquet(shapefile_path: str) -> Optional[str]:
+        """
+        Get a GeoParquet copy of a shapefile, converting it on first use.
+
+        Sources that are not plain files (directories, archives, URLs) are
+        not cached and are read directly.
+
+        Args:
+            shapefile_path: Path to the source shapefile
+
+        Returns:
+            Path to the GeoParquet copy, or None if the source can't be cached
+        """
+        if not os.path.isfile(shapefile_path):
+            return None
+
+        # Key the copy on the resolved path so same-named shapefiles in
+        # different directories don't share (and overwrite) one cache file
+        resolved = Path(shapefile_path).resolve()
+        path_hash = hashlib.sha1(str(resolved).encode()).hexdigest()[:8]
+        parquet_path = ensure_parquet(
+            shapefile_path,
+            os.path.join(
+                CACHE_DIR,
+                SHAPEFILE_CACHE_SUBDIR,
+                f"{resolved.stem}-{path_hash}.parquet",
+            ),
+        )
+        return None if parquet_path is None else str(parquet_path)
+
+    @staticmethod
+    def _read(
+        shapefile_path: str,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        attribute_filter: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+    ) -> gpd.GeoDataFrame:
+        """
+        Read a shapefile through its GeoParquet copy when one is available.
+
+        Attribute filters are pushed down to the reader: as pyarrow filters
+        for the GeoParquet copy, or as an OGR SQL where clause otherwise.
+
+        Args:
+            shapefile_path: Path to the source shapefile
+            bbox: Optional (minx, miny, maxx, maxy) filter in the data's CRS
+            attribute_filter: Optional column -> value (or list of values) map
+            columns: Optional attribute columns to read (geometry is implied)
+
+        Returns:
+            GeoDataFrame with the matching features
+        """
+        parquet_path = ShapefileLoader._ensure_parquet(shapefile_path)
+        if parquet_path is None:
+            return gpd.read_file(
+                shapefile_path,
+                bbox=bbox,
+                where=where_clause(attribute_filter),
+                columns=columns,
+            )
+
+        if columns is not None:
+            columns = [*columns, "geometry"]
+        filters = None
+        if attribute_filter:
+            filters = [
+                (
+                    column,
+                    "in" if isinstance(value, (list, tuple, set)) else "=",
+                    value,
+                )
+                for column, value in attribute_filter.items()
+            ]
+
+        return gpd.read_parquet(
+            parquet_path, bbox=bbox, filters=filters, columns=columns
+        )
+
+    @staticmethod
+    def load_counties(
+        shapefile_path: Optional[str] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        state_fp: Optional[str] = None,
+        names: Optional[List[str]] = None,
+        columns: Optional[List[str]] = None,
+    ) -> gpd.GeoDataFrame:
         """
         Load US counties shapefile.
 
         Args:
             shapefile_path: Optional custom path to counties shapefile
+            bbox: Optional (minx, miny, maxx, maxy) to load only nearby counties
+            state_fp: Optional state FIPS code to load a single state
+            names: Optional county names to load
+            columns: Optional attribute columns to load (geometry is implied)
 
         Returns:
             GeoDataFrame containing county geometries and attributes
@@ -32,8 +156,14 @@ class ShapefileLoader:
         if not os.path.exists(shapefile_path):
             raise FileNotFoundError(f"Counties shapefile not found: {shapefile_path}")
 
+        attribute_filter = {}
+        if state_fp is not None:
+            attribute_filter["STATEFP"] = state_fp
+        if names is not None:
+            attribute_filter["NAME"] = list(names)
+
         try:
-            gdf = gpd.read_file(shapefile_path)
+            gdf = ShapefileLoader._read(shapefile_path, bbox, attribute_filter, columns)
 
             if gdf.empty:
                 raise ValueError("Counties shapefile is empty")
@@ -42,18 +172,29 @@ class ShapefileLoader:
             if gdf.geometry.isna().all():
                 raise ValueError("Counties shapefile contains no valid geometries")
 
+            # Prepare the polygons in place so point-in-county predicates
+            # (e.g. a masjid sjoin) reuse GEOS's indexed prepared geometry;
+            # the indexes are only built on first use
+            shapely.prepare(gdf.geometry.values)
+
             return gdf
 
         except Exception as e:
             raise ValueError(f"Failed to load counties shapefile: {str(e)}")
 
     @staticmethod
-    def load_highways(shapefile_path: Optional[str] = None) -> gpd.GeoDataFrame:
+    def load_highways(
+        shapefile_path: Optional[str] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        columns: Optional[List[str]] = None,
+    ) -> gpd.GeoDataFrame:
         """
         Load US primary roads/highways shapefile.
 
         Args:
             shapefile_path: Optional custom path to highways shapefile
+            bbox: Optional (minx, miny, maxx, maxy) to load only nearby highways
+            columns: Optional attribute columns to load (geometry is implied)
 
         Returns:
             GeoDataFrame containing highway geometries and attributes
@@ -69,7 +210,7 @@ class ShapefileLoader:
             raise FileNotFoundError(f"Highways shapefile not found: {shapefile_path}")
 
         try:
-            gdf = gpd.read_file(shapefile_path)
+            gdf = ShapefileLoader._read(shapefile_path, bbox, columns=columns)
 
             if gdf.empty:
                 raise ValueError("Highways shapefile is empty")
@@ -87,12 +228,13 @@ class MasjidLoader:
     """Load and process masjid location data."""
 
     @staticmethod
-    def load_from_csv(csv_path: str) -> gpd.GeoDataFrame:
+    def load_from_csv(csv_path: Union[str, IO[str]]) -> gpd.GeoDataFrame:
         """
         Load masjid locations from CSV file.
 
         Args:
-            csv_path: Path to CSV file with masjid coordinates
+            csv_path: Path to CSV file with masjid coordinates, or an open
+                text stream with the same content
 
         Returns:
             GeoDataFrame with masjid points
@@ -101,7 +243,7 @@ class MasjidLoader:
             FileNotFoundError: If CSV file doesn't exist
             ValueError: If CSV format is invalid
         """
-        if not os.path.exists(csv_path):
+        if isinstance(csv_path, (str, os.PathLike)) and not os.path.exists(csv_path):
             raise FileNotFoundError(f"Masjid CSV file not found: {csv_path}")
 
         try:
@@ -113,14 +255,7 @@ class MasjidLoader:
             if missing_cols:
                 raise ValueError(f"Missing required columns: {missing_cols}")
 
-            # Create GeoDataFrame from coordinates
-            gdf = gpd.GeoDataFrame(
-                df,
-                geometry=gpd.points_from_xy(df.longitude, df.latitude),
-                crs="EPSG:4326",
-            )
-
-            return gdf
+            return points_gdf(df)
 
         except Exception as e:
             raise ValueError(f"Failed to load masjid CSV: {str(e)}")
@@ -151,19 +286,58 @@ class MasjidLoader:
             if missing_cols:
                 raise ValueError(f"Missing required columns: {missing_cols}")
 
-            # Create GeoDataFrame from coordinates
-            gdf = gpd.GeoDataFrame(
-                df,
-                geometry=gpd.points_from_xy(df.longitude, df.latitude),
-                crs="EPSG:4326",
-            )
-
-            return gdf
+            return points_gdf(df)
 
         except Exception as e:
             raise ValueError(f"Failed to load masjid data: {str(e)}")
 
 
+def points_gdf(df: pd.DataFrame) -> gpd.GeoDataFrame:
+    """
+    Build a point GeoDataFrame from 'longitude' and 'latitude' columns.
+
+    Both columns are converted to float arrays and passed to GEOS in a
+    single shapely.points call.
+
+    Args:
+        df: DataFrame with 'longitude' and 'latitude' columns
+
+    Returns:
+        GeoDataFrame with point geometries in EPSG:4326
+    """
+    geometry = shapely.points(
+        df["longitude"].to_numpy(dtype=float), df["latitude"].to_numpy(dtype=float)
+    )
+
+    return gpd.GeoDataFrame(df, geometry=geometry, crs="EPSG:4326")
+
+
+def where_clause(attribute_filter: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Build an OGR SQL where clause from a column -> value(s) mapping.
+
+    Args:
+        attribute_filter: Map of column name to a value or list of values
+
+    Returns:
+        Where clause joining one test per column with AND, or None if empty
+    """
+    if not attribute_filter:
+        return None
+
+    def quote(value: Any) -> str:
+        return "'" + str(value).replace("'", "''") + "'"
+
+    tests = []
+    for column, value in attribute_filter.items():
+        if isinstance(value, (list, tuple, set)):
+            tests.append(f"{column} IN ({', '.join(quote(v) for v in value)})")
+        else:
+            tests.append(f"{column} = {quote(value)}")
+
+    return " AND ".join(tests)
+
+
 def validate_crs_consistency(*gdfs: gpd.GeoDataFrame) -> bool:
     """
     Check if all GeoDataFrames have consistent CRS.
@@ -177,8 +351,11 @@ def validate_crs_consistency(*gdfs: gpd.GeoDataFrame) -> bool:
     if not gdfs:
         return True
 
-    first_crs = gdfs[0].crs
-    return all(gdf.crs == first_crs for gdf in gdfs)
+    # Layers usually share one CRS object, so dedupe by identity first and
+    # only run pyproj's (WKT-based) equality on the distinct objects
+    distinct_crs = list({id(gdf.crs): gdf.crs for gdf in gdfs}.values())
+    first_crs = distinct_crs[0]
+    return all(crs == first_crs for crs in distinct_crs[1:])
 
 
 def ensure_crs(
@@ -200,3 +377,28 @@ def ensure_crs(
         return gdf.to_crs(target_crs)
     else:
         return gdf
+
+
+def ensure_display_crs(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """
+    Ensure GeoDataFrame is in WGS84 for display, skipping no-op reprojections.
+
+    TIGER/Line data ships in NAD83 (EPSG:4269), which differs from WGS84 by
+    about a metre, so it is relabelled instead of reprojected vertex by vertex.
+
+    Args:
+        gdf: Input GeoDataFrame
+
+    Returns:
+        GeoDataFrame with EPSG:4326 CRS
+    """
+    if gdf.crs is None:
+        return gdf.set_crs("EPSG:4326")
+
+    epsg = gdf.crs.to_epsg()
+    if epsg == 4326:
+        return gdf
+    elif epsg in DISPLAY_EQUIVALENT_EPSG:
+        return gdf.set_crs("EPSG:4326", allow_override=True)
+    else:
+        return gdf.to_crs("EPSG:4326")
@@ -0,0 +1,73 @@
+"""Shared construction of masjid point layers."""
+
+from typing import Any, Dict, List, Optional
+
+import geopandas as gpd
+import numpy as np
+import shapely
+
+
+def masjid_coords(records: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Read masjid coordinates from a list of records in a single pass.
+
+    Args:
+        records: List of dicts with 'latitude' and 'longitude'
+
+    Returns:
+        Array of shape (N, 2) with (longitude, latitude) rows
+    """
+    return np.fromiter(
+        ((record["longitude"], record["latitude"]) for record in records),
+        dtype=np.dtype((np.float64, 2)),
+        count=len(records),
+    )
+
+
+def build_masjid_gdf(
+    records: List[Dict[str, Any]], coords: Optional[np.ndarray] = None
+) -> gpd.GeoDataFrame:
+    """
+    Build a masjid GeoDataFrame from a list of records.
+
+    The (N, 2) coordinate array is handed to GEOS as one ragged-array
+    buffer; callers that also plot the points can pass in the array they
+    keep, so it is not extracted again from the geometries.
+
+    Args:
+        records: List of dicts with 'name', 'latitude', 'longitude'
+        coords: Optional precomputed ``masjid_coords(records)``
+
+    Returns:
+        GeoDataFrame with masjid points in EPSG:4326
+    """
+    if coords is None:
+        coords = masjid_coords(records)
+    geometry = shapely.from_ragged_array(shapely.GeometryType.POINT, coords)
+
+    return gpd.GeoDataFrame(records, geometry=geometry, crs="EPSG:4326")
+
+
+# Sample masjid data shared by the map scripts
+MASJIDS = [
+    {
+        "name": "Islamic Center of Greater Cincinnati",
+        "latitude": 39.1031,
+        "longitude": -84.5120,
+    },
+    {"name": "Masjid Al-Noor NYC", "latitude": 40.7128, "longitude": -74.0060},
+    {"name": "Islamic Society of Boston", "latitude": 42.3601, "longitude": -71.0589},
+    {"name": "Dar Al-Hijrah VA", "latitude": 38.9072, "longitude": -77.0369},
+    {"name": "ICSC Los Angeles", "latitude": 34.0522, "longitude": -118.2437},
+    {"name": "Masjid Al-Farah Chicago", "latitude": 41.8781, "longitude": -87.6298},
+    {"name": "Islamic Center of Nashville", "latitude": 36.1627, "longitude": -86.7816},
+    {"name": "Masjid Al-Islam Phoenix", "latitude": 33.4484, "longitude": -112.0740},
+    {"name": "Islamic Center of Detroit", "latitude": 42.3314, "longitude": -83.0458},
+    {"name": "Masjid Al-Taqwa Houston", "latitude": 29.7604, "longitude": -95.3698},
+]
+
+# Built once at import and reused by every caller; the coordinate buffer
+# is shared with the scripts' scatter calls, so it is made read-only
+MASJID_COORDS = masjid_coords(MASJIDS)
+MASJID_COORDS.setflags(write=False)
+MASJIDS_GDF = build_masjid_gdf(MASJIDS, MASJID_COORDS)
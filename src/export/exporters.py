@@ -1,11 +1,70 @@
 """Export functionality for saving maps in various formats."""
 
+import io
 import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import matplotlib.pyplot as plt
-from typing import List, Optional
+import numpy as np
+from matplotlib.transforms import Bbox
+from PIL import Image
+from typing import List, Optional, Tuple
 from ..utils.config import OUTPUT_DIR, EXPORT_FORMATS, PNG_DPI, PDF_DPI
 
+SUPPORTED_FORMATS = ("png", "pdf", "svg")
+
+
+def _export_pickled_figure(
+    output_dir: str, figure_bytes: bytes, filename: str, fmt: str
+) -> str:
+    """Unpickle a figure in a worker process and export one format."""
+    fig = pickle.loads(figure_bytes)
+    try:
+        return MapExporter(output_dir)._export_one(fig, filename, fmt)
+    finally:
+        plt.close(fig)
+
+
+def render_tight_rgba(
+    fig: plt.Figure, pad_inches: float = 0.1
+) -> Tuple[np.ndarray, Bbox]:
+    """
+    Draw a figure once and crop its Agg buffer to the drawn content.
+
+    This matches ``bbox_inches="tight"`` without the extra measuring draw
+    savefig does, and the returned bbox can be passed as ``bbox_inches`` to
+    later savefig calls so they skip it too. When content reaches past the
+    canvas (e.g. a title above the figure), the Agg buffer doesn't hold it,
+    so the figure is rendered again through savefig at the tight bbox.
+
+    Args:
+        fig: Matplotlib figure drawn at its current DPI
+        pad_inches: Padding around the content in inches
+
+    Returns:
+        Tuple of (RGBA pixel array, tight bbox in inches)
+    """
+    fig.canvas.draw()
+    pixels = np.asarray(fig.canvas.buffer_rgba())
+
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(pad_inches)
+    x0, y0, x1, y1 = np.round(np.array(bbox.extents) * fig.dpi).astype(int)
+    height, width = pixels.shape[:2]
+
+    # Rows count down from the top of the canvas
+    top, bottom = height - y1, height - y0
+    if top >= 0 and bottom <= height and x0 >= 0 and x1 <= width:
+        return pixels[top:bottom, x0:x1], bbox
+
+    # Off-canvas content isn't in the buffer; render the tight bbox instead
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="rgba", dpi=fig.dpi, bbox_inches=bbox)
+    tight_width, tight_height = (np.array(bbox.size) * fig.dpi).astype(int)
+    pixels = np.frombuffer(buffer.getvalue(), dtype=np.uint8)
+
+    return pixels.reshape(tight_height, tight_width, 4), bbox
+
 
 class MapExporter:
     """Export maps to various formats with high quality settings."""
@@ -34,49 +93,77 @@ class MapExporter:
         """
         output_path = self.output_dir / f"{filename}.png"
 
-        fig.savefig(
-            output_path,
-            format="png",
-            dpi=dpi,
-            bbox_inches="tight",
-            pad_inches=0.1,
-            facecolor="white",
-            edgecolor="none",
+        # Draw once at the export DPI on a white background and encode the
+        # cropped Agg buffer with Pillow's fast zlib level instead of
+        # savefig's default; then restore the figure's own settings
+        original_dpi = fig.dpi
+        original_facecolor = fig.get_facecolor()
+        fig.set_dpi(dpi)
+        fig.set_facecolor("white")
+        try:
+            pixels, _ = render_tight_rgba(fig, pad_inches=0.1)
+        finally:
+            fig.set_dpi(original_dpi)
+            fig.set_facecolor(original_facecolor)
+
+        Image.fromarray(pixels).save(
+            output_path, format="PNG", compress_level=1, dpi=(dpi, dpi)
         )
 
         return str(output_path)
 
-    def export_pdf(self, fig: plt.Figure, filename: str) -> str:
+    def export_pdf(
+        self,
+        fig: plt.Figure,
+        filename: str,
+        rasterize_below: Optional[float] = None,
+        dpi: int = PDF_DPI,
+    ) -> str:
         """
         Export figure as vector PDF.
 
         Args:
             fig: Matplotlib figure to export
             filename: Output filename (without extension)
+            rasterize_below: Optional zorder below which artists are embedded
+                as one raster image instead of vector paths
+            dpi: Resolution of rasterized artists; vector content ignores it
 
         Returns:
             Path to exported file
         """
         output_path = self.output_dir / f"{filename}.pdf"
 
-        fig.savefig(
-            output_path,
-            format="pdf",
-            bbox_inches="tight",
-            pad_inches=0.1,
-            facecolor="white",
-            edgecolor="none",
-        )
+        # Only rasterize for this export, then restore each axes' setting
+        previous_zorders = [ax.get_rasterization_zorder() for ax in fig.axes]
+        if rasterize_below is not None:
+            for ax in fig.axes:
+                ax.set_rasterization_zorder(rasterize_below)
+
+        try:
+            fig.savefig(
+                output_path,
+                format="pdf",
+                dpi=dpi,
+                bbox_inches="tight",
+                pad_inches=0.1,
+                facecolor="white",
+                edgecolor="none",
+            )
+        finally:
+            for ax, zorder in zip(fig.axes, previous_zorders):
+                ax.set_rasterization_zorder(zorder)
 
         return str(output_path)
 
-    def export_svg(self, fig: plt.Figure, filename: str) -> str:
+    def export_svg(self, fig: plt.Figure, filename: str, dpi: int = PDF_DPI) -> str:
         """
         Export figure as vector SVG.
 
         Args:
             fig: Matplotlib figure to export
             filename: Output filename (without extension)
+            dpi: Resolution of rasterized artists; vector content ignores it
 
         Returns:
             Path to exported file
@@ -86,6 +173,7 @@ class MapExporter:
         fig.savefig(
             output_path,
             format="svg",
+            dpi=dpi,
             bbox_inches="tight",
             pad_inches=0.1,
             facecolor="white",
@@ -111,24 +199,68 @@ class MapExporter:
         if formats is None:
             formats = EXPORT_FORMATS
 
-        exported_files = []
-
+        supported = []
         for fmt in formats:
-            if fmt.lower() == "png":
-                path = self.export_png(fig, base_filename)
-            elif fmt.lower() == "pdf":
-                path = self.export_pdf(fig, base_filename)
-            elif fmt.lower() == "svg":
-                path = self.export_svg(fig, base_filename)
+            if fmt.lower() in SUPPORTED_FORMATS:
+                supported.append(fmt.lower())
             else:
                 print(f"Warning: Unsupported format '{fmt}' skipped")
-                continue
 
-            exported_files.append(path)
+        workers = min(len(supported), os.cpu_count() or 1)
+        exported_files = None
+        if workers > 1:
+            exported_files = self._export_in_processes(
+                fig, base_filename, supported, workers
+            )
+        if exported_files is None:
+            exported_files = [
+                self._export_one(fig, base_filename, fmt) for fmt in supported
+            ]
+
+        for path in exported_files:
             print(f"Exported: {path}")
 
         return exported_files
 
+    def _export_one(self, fig: plt.Figure, filename: str, fmt: str) -> str:
+        """Export a figure in one supported format."""
+        if fmt == "png":
+            return self.export_png(fig, filename)
+        elif fmt == "pdf":
+            return self.export_pdf(fig, filename)
+        else:
+            return self.export_svg(fig, filename)
+
+    def _export_in_processes(
+        self, fig: plt.Figure, base_filename: str, formats: List[str], workers: int
+    ) -> Optional[List[str]]:
+        """
+        Export each format from a copy of the figure in its own process.
+
+        Rendering and serialization hold the GIL, so threads would not
+        overlap; processes each render an unpickled copy of the figure.
+
+        Returns:
+            Paths in format order, or None if the figure can't be pickled
+        """
+        try:
+            figure_bytes = pickle.dumps(fig)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _export_pickled_figure,
+                    str(self.output_dir),
+                    figure_bytes,
+                    base_filename,
+                    fmt,
+                )
+                for fmt in formats
+            ]
+            return [future.result() for future in futures]
+
     def get_file_info(self, filepath: str) -> dict:
         """
         Get information about an exported file.
@@ -1,8 +1,9 @@
 """Main application for generating the US Masjid Map."""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
-from data.loaders import ShapefileLoader, MasjidLoader, ensure_crs
+from data.loaders import ShapefileLoader, MasjidLoader, ensure_display_crs
 from rendering.map_renderer import USMapRenderer
 from export.exporters import MapExporter
 
@@ -29,6 +30,9 @@ SAMPLE_MASJIDS = [
     {"name": "Masjid Al-Taqwa", "latitude": 29.7604, "longitude": -95.3698},
 ]
 
+# Built once at import; load_data hands out copies
+SAMPLE_MASJIDS_GDF = MasjidLoader.load_from_list(SAMPLE_MASJIDS)
+
 
 class USMasjidMapGenerator:
     """Main class for generating the US Masjid Map."""
@@ -41,6 +45,22 @@ class USMasjidMapGenerator:
         self.renderer = None
         self.exporter = None
 
+    def __enter__(self) -> "USMasjidMapGenerator":
+        """Own the figure for the block, e.g. for run(keep_figure=True)."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the figure when the block exits."""
+        self.cleanup()
+
+    def _check_loaded(self) -> bool:
+        """Return whether every map layer has been loaded."""
+        return (
+            self.counties_gdf is not None
+            and self.highways_gdf is not None
+            and self.masjids_gdf is not None
+        )
+
     def load_data(self, masjid_data: Optional[List[Dict[str, Any]]] = None) -> None:
         """
         Load all required data for the map.
@@ -51,25 +71,36 @@ class USMasjidMapGenerator:
         print("Loading data...")
 
         try:
-            # Load shapefiles
-            print("  Loading counties shapefile...")
-            self.counties_gdf = ShapefileLoader.load_counties()
-
-            print("  Loading highways shapefile...")
-            self.highways_gdf = ShapefileLoader.load_highways()
-
-            # Load masjid data
-            print("  Loading masjid data...")
-            if masjid_data is None:
-                masjid_data = SAMPLE_MASJIDS
-
-            self.masjids_gdf = MasjidLoader.load_from_list(masjid_data)
-
-            # Ensure consistent CRS (WGS84)
+            # Load shapefiles (through their GeoParquet cache) with only the
+            # columns the renderer uses: GEOID picks each county's color.
+            # The reads are independent and GDAL/Arrow release the GIL, so
+            # they run side by side while the masjid data is built
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                print("  Loading counties shapefile...")
+                counties_future = executor.submit(
+                    ShapefileLoader.load_counties, columns=["GEOID"]
+                )
+
+                print("  Loading highways shapefile...")
+                highways_future = executor.submit(
+                    ShapefileLoader.load_highways, columns=[]
+                )
+
+                # Load masjid data
+                print("  Loading masjid data...")
+                if masjid_data is None:
+                    self.masjids_gdf = SAMPLE_MASJIDS_GDF.copy()
+                else:
+                    self.masjids_gdf = MasjidLoader.load_from_list(masjid_data)
+
+                self.counties_gdf = counties_future.result()
+                self.highways_gdf = highways_future.result()
+
+            # Ensure consistent CRS (WGS84); NAD83 shapefiles are relabeled
+            # rather than reprojected, and masjid points are built in WGS84
             print("  Ensuring consistent coordinate systems...")
-            self.counties_gdf = ensure_crs(self.counties_gdf, "EPSG:4326")
-            self.highways_gdf = ensure_crs(self.highways_gdf, "EPSG:4326")
-            self.masjids_gdf = ensure_crs(self.masjids_gdf, "EPSG:4326")
+            self.counties_gdf = ensure_display_crs(self.counties_gdf)
+            self.highways_gdf = ensure_display_crs(self.highways_gdf)
 
             print(f"  Loaded {len(self.counties_gdf)} counties")
             print(f"  Loaded {len(self.highways_gdf)} highway segments")
@@ -86,16 +117,14 @@ class USMasjidMapGenerator:
         Args:
             title: Optional map title
         """
-        if any(
-            gdf is None
-            for gdf in [self.counties_gdf, self.highways_gdf, self.masjids_gdf]
-        ):
+        if not self._check_loaded():
             raise ValueError("Data must be loaded first. Call load_data().")
 
         print("Generating map...")
 
-        # Initialize renderer
-        self.renderer = USMapRenderer()
+        # Initialize renderer, keeping one whose figure is still open
+        if self.renderer is None or self.renderer.fig is None:
+            self.renderer = USMapRenderer()
 
         # Render complete map
         fig, ax = self.renderer.render_complete_map(
@@ -143,6 +172,7 @@ class USMasjidMapGenerator:
         masjid_data: Optional[List[Dict[str, Any]]] = None,
         title: Optional[str] = None,
         output_filename: str = "us_masjid_map",
+        keep_figure: bool = False,
     ) -> List[str]:
         """
         Run the complete map generation process.
@@ -151,6 +181,9 @@ class USMasjidMapGenerator:
             masjid_data: Optional masjid data
             title: Optional map title
             output_filename: Base filename for output
+            keep_figure: Keep the figure open so the next run redraws it
+                instead of allocating a new one; call cleanup() when done,
+                or use the generator as a context manager
 
         Returns:
             List of exported file paths
@@ -158,15 +191,11 @@ class USMasjidMapGenerator:
         try:
             self.load_data(masjid_data)
             self.generate_map(title)
-            exported_files = self.export_map(output_filename)
-            return exported_files
-
-        except Exception as e:
-            print(f"Error during map generation: {e}")
-            raise
+            return self.export_map(output_filename)
 
         finally:
-            self.cleanup()
+            if not keep_figure:
+                self.cleanup()
 
 
 def main():
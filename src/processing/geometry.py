@@ -0,0 +1,115 @@
+"""Geometry preprocessing to keep rendering cost proportional to output size."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Tuple
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+
+# Below this many geometries the thread pool costs more than it saves
+MIN_PARALLEL_GEOMETRIES = 1000
+
+
+def render_tolerance(extent_width: float, width_inches: float, dpi: int) -> float:
+    """
+    Compute a simplification tolerance that is invisible at the output size.
+
+    Args:
+        extent_width: Width of the map extent in data units (degrees)
+        width_inches: Width of the figure in inches
+        dpi: Dots per inch of the rendered output
+
+    Returns:
+        Half the data-space width of one output pixel
+    """
+    return 0.5 * extent_width / (width_inches * dpi)
+
+
+def select_in_extent(
+    gdf: gpd.GeoDataFrame, bbox: Tuple[float, float, float, float]
+) -> gpd.GeoDataFrame:
+    """
+    Select the rows whose geometry intersects a rectangular extent.
+
+    Uses the GeoDataFrame's STRtree spatial index, which is built once and
+    cached on the frame, instead of testing every geometry.
+
+    Args:
+        gdf: GeoDataFrame to filter
+        bbox: Extent as (minx, miny, maxx, maxy)
+
+    Returns:
+        Rows intersecting the extent, in their original order
+    """
+    keep = gdf.sindex.query(shapely.box(*bbox), predicate="intersects")
+
+    return gdf.iloc[np.sort(keep)]
+
+
+def simplify_geometries(
+    gdf: gpd.GeoDataFrame, tolerance: float, n_jobs: Optional[int] = None
+) -> gpd.GeoDataFrame:
+    """
+    Drop sub-pixel vertices with a vectorized Douglas-Peucker simplification.
+
+    Large layers are split into contiguous chunks simplified on a thread
+    pool; shapely releases the GIL inside GEOS, so the chunks run in parallel.
+
+    Args:
+        gdf: GeoDataFrame to simplify
+        tolerance: Maximum allowed displacement in data units
+        n_jobs: Number of worker threads (default: CPU count)
+
+    Returns:
+        Copy of the GeoDataFrame with simplified geometries
+    """
+    geometries = np.asarray(gdf.geometry.values)
+    n_jobs = n_jobs or os.cpu_count() or 1
+
+    if n_jobs == 1 or len(geometries) < MIN_PARALLEL_GEOMETRIES:
+        geometry = shapely.simplify(geometries, tolerance, preserve_topology=False)
+    else:
+        chunks = np.array_split(geometries, n_jobs)
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            simplified = executor.map(
+                lambda chunk: shapely.simplify(
+                    chunk, tolerance, preserve_topology=False
+                ),
+                chunks,
+            )
+            geometry = np.concatenate(list(simplified))
+
+    return gdf.set_geometry(
+        gpd.GeoSeries(geometry, index=gdf.index, crs=gdf.crs),
+    )
+
+
+def merge_lines_by_key(geometries: Any, keys: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Coalesce line geometries that share a key into as few parts as possible.
+
+    Parts are regrouped per key without noding, then ``shapely.line_merge``
+    joins parts that meet end to end, so long roads made of many short
+    segments become a handful of lines.
+
+    Args:
+        geometries: Array-like of LineString/MultiLineString geometries
+        keys: Array-like of group keys, one per geometry
+
+    Returns:
+        Tuple of (merged geometries, keys) with one entry per unique key,
+        in order of first appearance
+    """
+    codes, unique_keys = pd.factorize(np.asarray(keys))
+    parts, part_index = shapely.get_parts(np.asarray(geometries), return_index=True)
+
+    if len(parts) == 0:
+        return np.empty(0, dtype=object), np.asarray(unique_keys)
+
+    part_codes = codes[part_index]
+    order = np.argsort(part_codes, kind="stable")
+    grouped = shapely.multilinestrings(parts[order], indices=part_codes[order])
+    return shapely.line_merge(grouped), np.asarray(unique_keys)
@@ -0,0 +1,133 @@
+"""Greedy label placement on a coarse occupancy bitmap."""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+# Approximate glyph advance and line height as fractions of the font size
+CHAR_WIDTH_EM = 0.6
+LINE_HEIGHT_EM = 1.2
+
+# Box center offsets, in half box sizes: centered on the anchor first, then
+# the eight positions that keep the anchor on the box edge or corner
+CANDIDATE_OFFSETS = (
+    (0, 0),
+    (1, 0),
+    (-1, 0),
+    (0, 1),
+    (0, -1),
+    (1, 1),
+    (-1, 1),
+    (1, -1),
+    (-1, -1),
+)
+
+
+def text_box_size(
+    text: str, fontsize: float, pad: float = 0.0, rotation: float = 0.0
+) -> Tuple[float, float]:
+    """
+    Estimate the axis-aligned size of a (rotated) text box without rendering.
+
+    Args:
+        text: Label text; the longest line sets the width
+        fontsize: Font size in points
+        pad: Box padding as a fraction of the font size
+        rotation: Text rotation in degrees
+
+    Returns:
+        Tuple of (width, height) in points
+    """
+    lines = text.split("\n")
+    width = (CHAR_WIDTH_EM * max(len(line) for line in lines) + 2 * pad) * fontsize
+    height = (LINE_HEIGHT_EM * len(lines) + 2 * pad) * fontsize
+
+    theta = np.radians(rotation)
+    cos, sin = abs(np.cos(theta)), abs(np.sin(theta))
+    return width * cos + height * sin, width * sin + height * cos
+
+
+class LabelPlacer:
+    """Accept labels greedily, keeping only those that don't overlap."""
+
+    def __init__(
+        self,
+        extent: Tuple[float, float, float, float],
+        shape: Tuple[int, int] = (800, 800),
+    ):
+        """
+        Initialize an empty occupancy bitmap over a display extent.
+
+        Args:
+            extent: Placement area as (x0, y0, x1, y1) in display units
+            shape: Bitmap resolution as (rows, columns)
+        """
+        self.x0, self.y0, x1, y1 = extent
+        self.occupied = np.zeros(shape, dtype=bool)
+        self.scale_x = shape[1] / (x1 - self.x0)
+        self.scale_y = shape[0] / (y1 - self.y0)
+
+    def _cells(
+        self, x: float, y: float, width: float, height: float, clip: bool = False
+    ) -> Optional[Tuple[slice, slice]]:
+        """
+        Return the bitmap cells under a centered box.
+
+        Boxes reaching outside the extent give None, or are clipped to it.
+        """
+        rows, cols = self.occupied.shape
+        c0 = int(np.floor((x - width / 2 - self.x0) * self.scale_x))
+        c1 = int(np.ceil((x + width / 2 - self.x0) * self.scale_x))
+        r0 = int(np.floor((y - height / 2 - self.y0) * self.scale_y))
+        r1 = int(np.ceil((y + height / 2 - self.y0) * self.scale_y))
+
+        if clip:
+            c0, r0 = max(c0, 0), max(r0, 0)
+            c1, r1 = min(c1, cols), min(r1, rows)
+        elif c0 < 0 or r0 < 0 or c1 > cols or r1 > rows:
+            return None
+        return slice(r0, r1), slice(c0, c1)
+
+    def claim(self, x: float, y: float, width: float, height: float) -> None:
+        """
+        Mark a centered box as occupied, clipping it to the extent.
+
+        Args:
+            x: Box center x in display units
+            y: Box center y in display units
+            width: Box width in display units
+            height: Box height in display units
+        """
+        self.occupied[self._cells(x, y, width, height, clip=True)] = True
+
+    def place(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        offsets: Sequence[Tuple[float, float]] = CANDIDATE_OFFSETS,
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Find the first free candidate position around an anchor and claim it.
+
+        Args:
+            x: Anchor x in display units
+            y: Anchor y in display units
+            width: Label box width in display units
+            height: Label box height in display units
+            offsets: Candidate box center offsets in half box sizes, in
+                order of preference
+
+        Returns:
+            Center of the claimed box, or None if every candidate overlaps
+        """
+        for dx, dy in offsets:
+            cx = x + dx * width / 2
+            cy = y + dy * height / 2
+            cells = self._cells(cx, cy, width, height)
+            if cells is not None and not self.occupied[cells].any():
+                self.occupied[cells] = True
+                return cx, cy
+
+        return None
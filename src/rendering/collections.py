@@ -0,0 +1,86 @@
+"""Build matplotlib collections straight from shapely geometry arrays."""
+
+from typing import Any, Optional
+
+import numpy as np
+import shapely
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.path import Path
+
+
+def build_line_collection(
+    geometries: Any, geometry_colors: Optional[Any] = None, **kwargs: Any
+) -> LineCollection:
+    """
+    Build a single LineCollection from an array of line geometries.
+
+    All coordinates are pulled out of GEOS in one call and split into
+    per-part segments, so the whole layer is drawn as one artist.
+
+    Args:
+        geometries: Array-like of LineString/MultiLineString geometries
+        geometry_colors: Optional colors, one per input geometry, repeated
+            for each of its line parts
+        **kwargs: Style keyword arguments for LineCollection
+
+    Returns:
+        LineCollection with one segment per line part
+    """
+    parts, part_index = shapely.get_parts(np.asarray(geometries), return_index=True)
+    counts = shapely.get_num_coordinates(parts)
+    keep = counts >= 2
+    parts = parts[keep]
+    counts = counts[keep]
+
+    coords = shapely.get_coordinates(parts)
+    segments = np.split(coords, np.cumsum(counts)[:-1]) if len(counts) else []
+
+    if geometry_colors is not None:
+        kwargs["colors"] = to_rgba_array(geometry_colors)[part_index[keep]]
+
+    return LineCollection(segments, **kwargs)
+
+
+def build_polygon_collection(geometries: Any, **kwargs: Any) -> PathCollection:
+    """
+    Build a single PathCollection from an array of polygon geometries.
+
+    Coordinates and ring offsets come from one ``shapely.to_ragged_array``
+    call; each geometry becomes one compound path so holes and multipolygon
+    parts are kept, and per-geometry styles stay aligned with the input.
+
+    Args:
+        geometries: Array-like of Polygon/MultiPolygon geometries
+        **kwargs: Style keyword arguments for PathCollection
+
+    Returns:
+        PathCollection with one path per input geometry
+
+    Raises:
+        ValueError: If the geometries are not polygonal
+    """
+    geom_type, coords, offsets = shapely.to_ragged_array(np.asarray(geometries))
+
+    if geom_type == shapely.GeometryType.POLYGON:
+        ring_offsets, geom_rings = offsets
+    elif geom_type == shapely.GeometryType.MULTIPOLYGON:
+        ring_offsets, part_offsets, geom_parts = offsets
+        geom_rings = part_offsets[geom_parts]
+    else:
+        raise ValueError(f"Expected polygon geometries, got {geom_type.name}")
+
+    # Start each ring with MOVETO and close it with CLOSEPOLY
+    codes = np.full(len(coords), Path.LINETO, dtype=Path.code_type)
+    codes[ring_offsets[:-1]] = Path.MOVETO
+    codes[ring_offsets[1:] - 1] = Path.CLOSEPOLY
+
+    bounds = ring_offsets[geom_rings[1:-1]]
+    paths = [
+        Path(vertices, path_codes)
+        for vertices, path_codes in zip(
+            np.split(coords, bounds), np.split(codes, bounds)
+        )
+    ]
+
+    return PathCollection(paths, **kwargs)
@@ -0,0 +1,51 @@
+"""Color helpers for drawing map layers."""
+
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+from matplotlib.colors import to_rgba, to_rgba_array
+
+
+def blend_alpha(
+    colors: Sequence[Any], alpha: float, background: Any = "white"
+) -> np.ndarray:
+    """
+    Bake a constant alpha into colors by compositing them over a background.
+
+    Drawing the result opaquely looks the same as drawing the original
+    colors with ``alpha`` over the background, without per-pixel blending.
+
+    Args:
+        colors: Sequence of matplotlib color specifications
+        alpha: Opacity the colors would have been drawn with
+        background: Color the layer is drawn over
+
+    Returns:
+        Array of shape (N, 4) with opaque RGBA colors
+    """
+    rgba = to_rgba_array(colors)
+    background_rgb = np.asarray(to_rgba(background))[:3]
+
+    rgba[:, :3] = alpha * rgba[:, :3] + (1 - alpha) * background_rgb
+    rgba[:, 3] = 1.0
+
+    return rgba
+
+
+def palette_indices(keys: Any, n_colors: int) -> np.ndarray:
+    """
+    Assign each key a stable palette index by hashing it.
+
+    The same key gets the same color on every run, so renders are
+    reproducible without storing a color column.
+
+    Args:
+        keys: Array-like of feature identifiers (e.g. county GEOIDs)
+        n_colors: Number of colors in the palette
+
+    Returns:
+        Integer array of palette indices in [0, n_colors)
+    """
+    hashes = pd.util.hash_array(np.asarray(keys, dtype=object))
+    return (hashes % np.uint64(n_colors)).astype(np.intp)
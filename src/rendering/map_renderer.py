@@ -1,11 +1,18 @@
 """Main map rendering functionality."""
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 from matplotlib.colors import ListedColormap
+from matplotlib.transforms import offset_copy
 import geopandas as gpd
-import numpy as np
-from typing import Optional, Tuple, List
+import shapely
+from typing import TYPE_CHECKING, Optional, Tuple, List
+from .collections import build_line_collection
+from .colors import palette_indices
+from ..processing.geometry import (
+    render_tolerance,
+    select_in_extent,
+    simplify_geometries,
+)
+from ..processing.labels import LabelPlacer, text_box_size
 from ..utils.config import (
     MAP_WIDTH_INCHES,
     MAP_HEIGHT_INCHES,
@@ -19,9 +26,14 @@ from ..utils.config import (
     MASJID_COLOR,
     MASJID_SIZE,
     MASJID_SYMBOL,
+    MASJID_LABEL_SIZE,
     TITLE_FONT_SIZE,
 )
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 
 class USMapRenderer:
     """Render the complete US map with counties, highways, and masjids."""
@@ -37,13 +49,16 @@ class USMapRenderer:
         self.fig = None
         self.ax = None
 
-    def create_figure(self) -> Tuple[plt.Figure, plt.Axes]:
+    def create_figure(self) -> Tuple["Figure", "Axes"]:
         """
         Create the main figure and axes for the map.
 
         Returns:
             Tuple of (figure, axes) objects
         """
+        # pyplot is imported on first use so loading the module stays cheap
+        import matplotlib.pyplot as plt
+
         self.fig, self.ax = plt.subplots(
             figsize=(MAP_WIDTH_INCHES, MAP_HEIGHT_INCHES), dpi=self.dpi
         )
@@ -52,11 +67,21 @@ class USMapRenderer:
         self.ax.set_aspect("equal")
         self.ax.axis("off")
 
-        # Set tight layout
-        plt.tight_layout(pad=0)
+        # Fixed layout leaving room for the title above the axes, so
+        # tight_layout's measuring draw isn't needed
+        self.fig.subplots_adjust(left=0, right=1, bottom=0, top=0.95)
 
         return self.fig, self.ax
 
+    def reset(self) -> None:
+        """Clear the axes so the existing figure can be drawn again."""
+        if self.ax is None:
+            raise ValueError("Must call create_figure() first")
+
+        self.ax.cla()
+        self.ax.set_aspect("equal")
+        self.ax.axis("off")
+
     def render_counties(self, counties_gdf: gpd.GeoDataFrame) -> None:
         """
         Render US counties with pastel colors.
@@ -67,18 +92,22 @@ class USMapRenderer:
         if self.ax is None:
             raise ValueError("Must call create_figure() first")
 
-        # Create color mapping for counties
-        n_counties = len(counties_gdf)
-        color_indices = np.random.choice(len(COUNTY_COLORS), n_counties)
-        colors = [COUNTY_COLORS[i] for i in color_indices]
+        # Color counties by a hash of their GEOID so renders are reproducible
+        keys = counties_gdf["GEOID"] if "GEOID" in counties_gdf else counties_gdf.index
+        color_indices = palette_indices(keys, len(COUNTY_COLORS))
 
-        # Plot counties
+        # Plot counties, resolving the palette indices through a colormap;
+        # vector exports embed them as one raster instead of every vertex
         counties_gdf.plot(
             ax=self.ax,
-            color=colors,
+            column=color_indices,
+            cmap=ListedColormap(COUNTY_COLORS),
+            vmin=0,
+            vmax=len(COUNTY_COLORS) - 1,
             edgecolor=COUNTY_EDGE_COLOR,
             linewidth=COUNTY_EDGE_WIDTH,
             alpha=COUNTY_ALPHA,
+            rasterized=True,
         )
 
     def render_highways(self, highways_gdf: gpd.GeoDataFrame) -> None:
@@ -91,9 +120,14 @@ class USMapRenderer:
         if self.ax is None:
             raise ValueError("Must call create_figure() first")
 
-        # Plot highways
-        highways_gdf.plot(
-            ax=self.ax, color=HIGHWAY_COLOR, linewidth=HIGHWAY_WIDTH, alpha=0.8
+        # Plot all highways as a single LineCollection
+        self.ax.add_collection(
+            build_line_collection(
+                highways_gdf.geometry.values,
+                colors=HIGHWAY_COLOR,
+                linewidths=HIGHWAY_WIDTH,
+                alpha=0.8,
+            )
         )
 
     def render_masjids(self, masjids_gdf: gpd.GeoDataFrame) -> None:
@@ -106,26 +140,67 @@ class USMapRenderer:
         if self.ax is None:
             raise ValueError("Must call create_figure() first")
 
-        # Plot masjid points
-        masjids_gdf.plot(
-            ax=self.ax,
-            color=MASJID_COLOR,
+        # Plot all masjid points as one scatter collection
+        masjid_xy = shapely.get_coordinates(masjids_gdf.geometry.values)
+        self.ax.scatter(
+            masjid_xy[:, 0],
+            masjid_xy[:, 1],
+            c=MASJID_COLOR,
             marker=MASJID_SYMBOL,
-            markersize=MASJID_SIZE,
+            s=MASJID_SIZE,
             alpha=0.9,
         )
 
-        # Add labels for each masjid
-        for idx, row in masjids_gdf.iterrows():
-            self.ax.annotate(
-                row["name"],
-                xy=(row.geometry.x, row.geometry.y),
-                xytext=(5, 5),  # Offset from point
-                textcoords="offset points",
-                fontsize=8,
+        # Label masjids with plain text sharing one offset transform and
+        # one box style; where masjids crowd together, later labels that
+        # would overlap an earlier one are skipped
+        label_offset = 5
+        label_transform = offset_copy(
+            self.ax.transData,
+            fig=self.fig,
+            x=label_offset,
+            y=label_offset,
+            units="points",
+        )
+        label_bbox = dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.7)
+
+        names = masjids_gdf["name"].tolist()
+        box_sizes = [text_box_size(name, MASJID_LABEL_SIZE, pad=0.3) for name in names]
+        points_to_pixels = self.fig.dpi / 72
+        offset_px = label_offset * points_to_pixels
+
+        # Labels may reach past the axes, so pad the placement extent
+        self.ax.apply_aspect()
+        largest = max((max(size) for size in box_sizes), default=0)
+        margin = offset_px + largest * points_to_pixels
+        x0, y0, x1, y1 = self.ax.bbox.extents
+        placer = LabelPlacer((x0 - margin, y0 - margin, x1 + margin, y1 + margin))
+
+        masjid_px = self.ax.transData.transform(masjid_xy)
+        for name, (x, y), (px, py), (width, height) in zip(
+            names, masjid_xy, masjid_px, box_sizes
+        ):
+            # Only the default spot is tried: the box's lower-left corner
+            # at the label offset
+            spot = placer.place(
+                px + offset_px,
+                py + offset_px,
+                width * points_to_pixels,
+                height * points_to_pixels,
+                offsets=[(1, 1)],
+            )
+            if spot is None:
+                continue
+
+            self.ax.text(
+                x,
+                y,
+                name,
+                transform=label_transform,
+                fontsize=MASJID_LABEL_SIZE,
                 ha="left",
                 va="bottom",
-                bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.7),
+                bbox=label_bbox,
             )
 
     def add_title(self, title: str = "US Counties, Highways, and Masjids") -> None:
@@ -167,7 +242,7 @@ class USMapRenderer:
         highways_gdf: gpd.GeoDataFrame,
         masjids_gdf: gpd.GeoDataFrame,
         title: Optional[str] = None,
-    ) -> Tuple[plt.Figure, plt.Axes]:
+    ) -> Tuple["Figure", "Axes"]:
         """
         Render the complete map with all layers.
 
@@ -180,12 +255,24 @@ class USMapRenderer:
         Returns:
             Tuple of (figure, axes) objects
         """
-        # Create figure
-        self.create_figure()
+        # Create the figure, or clear and reuse one from a previous render
+        if self.fig is None:
+            self.create_figure()
+        else:
+            self.reset()
 
         # Set extent based on counties (largest layer)
         self.set_extent(counties_gdf)
 
+        # Drop highways that fall entirely outside the extent
+        (x0, x1), (y0, y1) = self.ax.get_xlim(), self.ax.get_ylim()
+        highways_gdf = select_in_extent(highways_gdf, (x0, y0, x1, y1))
+
+        # Drop vertices closer together than an output pixel
+        tolerance = render_tolerance(x1 - x0, MAP_WIDTH_INCHES, self.dpi)
+        counties_gdf = simplify_geometries(counties_gdf, tolerance)
+        highways_gdf = simplify_geometries(highways_gdf, tolerance)
+
         # Render layers in order (bottom to top)
         self.render_counties(counties_gdf)
         self.render_highways(highways_gdf)
@@ -200,6 +287,8 @@ class USMapRenderer:
     def close(self) -> None:
         """Close the figure to free memory."""
         if self.fig:
+            import matplotlib.pyplot as plt
+
             plt.close(self.fig)
             self.fig = None
             self.ax = None
@@ -41,10 +41,21 @@ TITLE_FONT_SIZE = 24
 LABEL_FONT_SIZE = 10
 HIGHWAY_LABEL_SIZE = 8
 
+# Southern California map
+TARGET_STATE_FP = "06"  # California
+TARGET_COUNTIES = ["Los Angeles", "Orange", "Riverside", "San Bernardino"]
+MASJID = {
+    "name": "Orange County Masjid",
+    "latitude": 34.0633,
+    "longitude": -117.6509,
+    "address": "1027 E Philadelphia St, Ontario, CA 91761",
+}
+
 # File paths
 DATA_DIR = "data"
 SHAPEFILES_DIR = f"{DATA_DIR}/shapefiles"
 MASJIDS_DIR = f"{DATA_DIR}/masjids"
+CACHE_DIR = f"{DATA_DIR}/cache"
 OUTPUT_DIR = "output"
 
 # Shapefile names
@@ -54,4 +65,4 @@ HIGHWAYS_SHAPEFILE = "tl_2023_us_primaryroads.shp"
 # Export settings
 EXPORT_FORMATS = ["png", "pdf", "svg"]
 PNG_DPI = PRINT_DPI
-PDF_DPI = PRINT_DPI
+PDF_DPI = 150  # Vector content ignores DPI; only rasterized layers use it
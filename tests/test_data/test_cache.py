@@ -0,0 +1,69 @@
+"""Tests for GeoParquet layer caching."""
+
+import os
+
+import geopandas as gpd
+from shapely.geometry import Point
+
+from src.data.cache import ensure_parquet, load_or_cache
+
+
+def _write_shapefile(path):
+    """Write a small point shapefile for cache tests."""
+    gdf = gpd.GeoDataFrame(
+        {"NAME": ["A", "B"]}, geometry=[Point(0, 0), Point(1, 1)], crs="EPSG:4326"
+    )
+    gdf.to_file(path)
+
+
+class TestLoadOrCache:
+    """Test cases for load_or_cache."""
+
+    def test_load_or_cache_writes_and_reuses_cache(self, tmp_path):
+        """Test that the preprocessed layer is cached and reused."""
+        shp_path = tmp_path / "points.shp"
+        cache_path = tmp_path / "cache" / "points.parquet"
+        _write_shapefile(shp_path)
+        calls = []
+
+        def preprocess(gdf):
+            calls.append(len(gdf))
+            return gdf.iloc[:1]
+
+        first = load_or_cache(shp_path, cache_path, preprocess)
+        second = load_or_cache(shp_path, cache_path, preprocess)
+
+        assert cache_path.exists()
+        assert calls == [2]
+        assert len(first) == len(second) == 1
+        assert second.crs == "EPSG:4326"
+
+    def test_load_or_cache_rebuilds_stale_cache(self, tmp_path):
+        """Test that a cache older than the shapefile is rebuilt."""
+        shp_path = tmp_path / "points.shp"
+        cache_path = tmp_path / "points.parquet"
+        _write_shapefile(shp_path)
+
+        load_or_cache(shp_path, cache_path)
+        stale_time = os.path.getmtime(shp_path) - 10
+        os.utime(cache_path, (stale_time, stale_time))
+
+        result = load_or_cache(shp_path, cache_path, lambda gdf: gdf.iloc[:1])
+
+        assert len(result) == 1
+
+
+class TestEnsureParquet:
+    """Test cases for ensure_parquet."""
+
+    def test_ensure_parquet_supports_bbox_reads(self, tmp_path):
+        """Test that the full copy can be read back with a bbox filter."""
+        shp_path = tmp_path / "points.shp"
+        cache_path = tmp_path / "cache" / "points.parquet"
+        _write_shapefile(shp_path)
+
+        result = ensure_parquet(shp_path, cache_path)
+
+        assert result == cache_path
+        assert len(gpd.read_parquet(result)) == 2
+        assert list(gpd.read_parquet(result, bbox=(0.5, 0.5, 2, 2))["NAME"]) == ["B"]
@@ -1,18 +1,20 @@
 """Tests for data loading functionality."""
 
 import pytest
-import tempfile
-import os
+import io
 from unittest.mock import patch, MagicMock
 import geopandas as gpd
 import pandas as pd
-from shapely.geometry import Point, Polygon
+import shapely
+from shapely.geometry import LineString, Point, Polygon
 
 from src.data.loaders import (
     ShapefileLoader,
     MasjidLoader,
     validate_crs_consistency,
     ensure_crs,
+    ensure_display_crs,
+    where_clause,
 )
 
 
@@ -63,6 +65,96 @@ class TestShapefileLoader:
         with pytest.raises(FileNotFoundError):
             ShapefileLoader.load_highways("nonexistent.shp")
 
+    def test_load_highways_bbox_uses_parquet_copy(self, tmp_path, monkeypatch):
+        """Test that highways are cached as GeoParquet and filtered by bbox."""
+        monkeypatch.setattr("src.data.loaders.CACHE_DIR", str(tmp_path / "cache"))
+        shp_path = str(tmp_path / "roads.shp")
+        gpd.GeoDataFrame(
+            {"FULLNAME": ["I- 10", "I- 5"]},
+            geometry=[
+                LineString([(-118, 34), (-117, 34)]),
+                LineString([(-122, 47), (-121, 47)]),
+            ],
+            crs="EPSG:4269",
+        ).to_file(shp_path)
+
+        result = ShapefileLoader.load_highways(shp_path, bbox=(-119, 33, -116, 35))
+
+        assert (
+            len(list((tmp_path / "cache" / "shapefiles").glob("roads-*.parquet"))) == 1
+        )
+        assert list(result["FULLNAME"]) == ["I- 10"]
+        assert result.crs == "EPSG:4269"
+
+    def test_same_named_shapefiles_get_separate_caches(self, tmp_path, monkeypatch):
+        """Test that same-named shapefiles in two folders get two caches."""
+        monkeypatch.setattr("src.data.loaders.CACHE_DIR", str(tmp_path / "cache"))
+        paths = []
+        for folder, name in [("east", "I- 95"), ("west", "I- 5")]:
+            (tmp_path / folder).mkdir()
+            paths.append(str(tmp_path / folder / "roads.shp"))
+            gpd.GeoDataFrame(
+                {"FULLNAME": [name]},
+                geometry=[LineString([(0, 0), (1, 1)])],
+                crs="EPSG:4269",
+            ).to_file(paths[-1])
+
+        names = [list(ShapefileLoader.load_highways(p)["FULLNAME"]) for p in paths]
+
+        assert names == [["I- 95"], ["I- 5"]]
+        assert (
+            len(list((tmp_path / "cache" / "shapefiles").glob("roads-*.parquet"))) == 2
+        )
+
+    def test_load_highways_columns(self, tmp_path, monkeypatch):
+        """Test that only the requested highway columns are loaded."""
+        monkeypatch.setattr("src.data.loaders.CACHE_DIR", str(tmp_path / "cache"))
+        shp_path = str(tmp_path / "roads.shp")
+        gpd.GeoDataFrame(
+            {"LINEARID": ["1101"], "FULLNAME": ["I- 10"], "RTTYP": ["I"]},
+            geometry=[LineString([(-118, 34), (-117, 34)])],
+            crs="EPSG:4269",
+        ).to_file(shp_path)
+
+        result = ShapefileLoader.load_highways(shp_path, columns=["RTTYP", "FULLNAME"])
+
+        assert set(result.columns) == {"RTTYP", "FULLNAME", "geometry"}
+
+    def test_load_counties_filters_state_and_names(self, tmp_path, monkeypatch):
+        """Test that state and name filters are pushed into the read."""
+        monkeypatch.setattr("src.data.loaders.CACHE_DIR", str(tmp_path / "cache"))
+        shp_path = str(tmp_path / "counties.shp")
+        square = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+        gpd.GeoDataFrame(
+            {
+                "NAME": ["Orange", "Orange", "Kern"],
+                "STATEFP": ["06", "12", "06"],
+                "GEOID": ["06059", "12095", "06029"],
+            },
+            geometry=[square, square, square],
+            crs="EPSG:4269",
+        ).to_file(shp_path)
+
+        result = ShapefileLoader.load_counties(
+            shp_path, state_fp="06", names=["Orange"], columns=["NAME"]
+        )
+
+        assert len(result) == 1
+        assert list(result.columns) == ["NAME", "geometry"]
+        assert shapely.is_prepared(result.geometry.values).all()
+
+    def test_clear_cache_removes_parquet_copies(self, tmp_path, monkeypatch):
+        """Test that clearing deletes only the loader's own GeoParquet copies."""
+        cache_dir = tmp_path / "cache"
+        (cache_dir / "shapefiles").mkdir(parents=True)
+        (cache_dir / "shapefiles" / "roads-0123abcd.parquet").write_bytes(b"")
+        (cache_dir / "counties.parquet").write_bytes(b"")
+        monkeypatch.setattr("src.data.loaders.CACHE_DIR", str(cache_dir))
+
+        assert ShapefileLoader.clear_cache() == 1
+        assert list((cache_dir / "shapefiles").iterdir()) == []
+        assert (cache_dir / "counties.parquet").exists()
+
 
 class TestMasjidLoader:
     """Test cases for MasjidLoader."""
@@ -79,38 +171,23 @@ class TestMasjidLoader:
 Masjid 1,40.7128,-74.0060
 Masjid 2,34.0522,-118.2437"""
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            f.write(csv_data)
-            f.flush()
-
-            try:
-                result = MasjidLoader.load_from_csv(f.name)
+        result = MasjidLoader.load_from_csv(io.StringIO(csv_data))
 
-                assert isinstance(result, gpd.GeoDataFrame)
-                assert len(result) == 2
-                assert "name" in result.columns
-                assert result.crs == "EPSG:4326"
-
-                # Check geometry
-                assert all(isinstance(geom, Point) for geom in result.geometry)
+        assert isinstance(result, gpd.GeoDataFrame)
+        assert len(result) == 2
+        assert "name" in result.columns
+        assert result.crs == "EPSG:4326"
 
-            finally:
-                os.unlink(f.name)
+        # Check geometry
+        assert all(isinstance(geom, Point) for geom in result.geometry)
 
     def test_load_from_csv_missing_columns(self):
         """Test CSV with missing required columns."""
         csv_data = """name,lat,lng
 Masjid 1,40.7128,-74.0060"""
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            f.write(csv_data)
-            f.flush()
-
-            try:
-                with pytest.raises(ValueError, match="Missing required columns"):
-                    MasjidLoader.load_from_csv(f.name)
-            finally:
-                os.unlink(f.name)
+        with pytest.raises(ValueError, match="Missing required columns"):
+            MasjidLoader.load_from_csv(io.StringIO(csv_data))
 
     def test_load_from_list_success(self):
         """Test successful loading from list."""
@@ -173,3 +250,29 @@ class TestUtilityFunctions:
 
         assert result.crs == "EPSG:4326"
         assert result.equals(gdf)
+
+    def test_ensure_display_crs_relabels_nad83(self):
+        """Test that NAD83 is relabelled to WGS84 without moving coordinates."""
+        gdf = gpd.GeoDataFrame({"geometry": [Point(-117.65, 34.06)]}, crs="EPSG:4269")
+        result = ensure_display_crs(gdf)
+
+        assert result.crs == "EPSG:4326"
+        assert result.geometry.iloc[0].equals(Point(-117.65, 34.06))
+
+    def test_ensure_display_crs_reprojects_other(self):
+        """Test that non-equivalent CRSs are reprojected."""
+        gdf = gpd.GeoDataFrame({"geometry": [Point(0, 0)]}, crs="EPSG:3857")
+        result = ensure_display_crs(gdf)
+
+        assert result.crs == "EPSG:4326"
+        assert result.geometry.iloc[0].x == pytest.approx(0)
+
+    def test_where_clause_quotes_values(self):
+        """Test building a where clause from scalar and list filters."""
+        result = where_clause({"STATEFP": "06", "NAME": ["Orange", "O'Brien"]})
+
+        assert result == "STATEFP = '06' AND NAME IN ('Orange', 'O''Brien')"
+
+    def test_where_clause_empty(self):
+        """Test that no filter gives no where clause."""
+        assert where_clause(None) is None
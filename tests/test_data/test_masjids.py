@@ -0,0 +1,56 @@
+"""Tests for masjid GeoDataFrame construction."""
+
+import geopandas as gpd
+import numpy as np
+import shapely
+from shapely.geometry import Point
+
+from src.data.masjids import MASJID_COORDS, MASJIDS, MASJIDS_GDF, build_masjid_gdf
+
+
+class TestBuildMasjidGdf:
+    """Test cases for build_masjid_gdf."""
+
+    def test_build_masjid_gdf_success(self):
+        """Test building points from a list of records."""
+        records = [
+            {"name": "Masjid 1", "latitude": 40.7128, "longitude": -74.0060},
+            {"name": "Masjid 2", "latitude": 34.0522, "longitude": -118.2437},
+        ]
+
+        result = build_masjid_gdf(records)
+
+        assert isinstance(result, gpd.GeoDataFrame)
+        assert len(result) == 2
+        assert result.crs == "EPSG:4326"
+        assert list(result["name"]) == ["Masjid 1", "Masjid 2"]
+        assert result.geometry.iloc[0].equals(Point(-74.0060, 40.7128))
+        assert result.geometry.iloc[1].equals(Point(-118.2437, 34.0522))
+
+    def test_build_masjid_gdf_keeps_extra_fields(self):
+        """Test that additional record fields become columns."""
+        records = [
+            {
+                "name": "Masjid 1",
+                "latitude": 34.0633,
+                "longitude": -117.6509,
+                "address": "1027 E Philadelphia St",
+            }
+        ]
+
+        result = build_masjid_gdf(records)
+
+        assert result["address"].iloc[0] == "1027 E Philadelphia St"
+
+    def test_masjids_gdf_matches_records(self):
+        """Test that the shared GeoDataFrame mirrors the MASJIDS records."""
+        assert len(MASJIDS_GDF) == len(MASJIDS)
+        assert list(MASJIDS_GDF["name"]) == [m["name"] for m in MASJIDS]
+        assert MASJIDS_GDF.crs == "EPSG:4326"
+
+    def test_masjid_coords_match_geometries(self):
+        """Test that the shared coordinate buffer matches the points."""
+        np.testing.assert_array_equal(
+            MASJID_COORDS, shapely.get_coordinates(MASJIDS_GDF.geometry.values)
+        )
+        assert not MASJID_COORDS.flags.writeable
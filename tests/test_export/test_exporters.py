@@ -0,0 +1,114 @@
+"""Tests for map export functionality."""
+
+import os
+
+import matplotlib.pyplot as plt
+from PIL import Image
+
+from src.export.exporters import MapExporter, render_tight_rgba
+
+
+class TestExportPng:
+    """Test cases for MapExporter.export_png."""
+
+    def test_export_png_at_requested_dpi(self, tmp_path):
+        """Test rendering at the export DPI without changing the figure."""
+        fig = plt.figure(figsize=(2, 2), dpi=50)
+        fig.text(0.5, 0.5, "Masjid", ha="center", va="center")
+
+        path = MapExporter(str(tmp_path)).export_png(fig, "map", dpi=100)
+        figure_dpi = fig.dpi
+        plt.close(fig)
+
+        with Image.open(path) as image:
+            assert image.format == "PNG"
+            assert round(image.info["dpi"][0]) == 100
+            assert image.width > 50
+        assert figure_dpi == 50
+
+
+class TestExportPdf:
+    """Test cases for MapExporter.export_pdf."""
+
+    def test_export_pdf_vector_by_default(self, tmp_path):
+        """Test that a plain export embeds no raster images."""
+        fig, ax = plt.subplots()
+        ax.plot([0, 1], [0, 1], zorder=1)
+
+        path = MapExporter(str(tmp_path)).export_pdf(fig, "map")
+        plt.close(fig)
+
+        assert b"/Subtype /Image" not in open(path, "rb").read()
+
+    def test_export_pdf_rasterize_below(self, tmp_path):
+        """Test that low-zorder artists are rasterized only for the export."""
+        fig, ax = plt.subplots()
+        ax.plot([0, 1], [0, 1], zorder=1)
+
+        path = MapExporter(str(tmp_path)).export_pdf(fig, "map", rasterize_below=2)
+        zorder_after = ax.get_rasterization_zorder()
+        plt.close(fig)
+
+        assert b"/Subtype /Image" in open(path, "rb").read()
+        assert zorder_after is None
+
+
+class TestRenderTightRgba:
+    """Test cases for render_tight_rgba."""
+
+    def test_render_tight_rgba_crops_to_content(self):
+        """Test that the buffer is cropped to the content plus padding."""
+        fig = plt.figure(figsize=(4, 4), dpi=50)
+        fig.text(0.5, 0.5, "Masjid", ha="center", va="center")
+
+        pixels, bbox = render_tight_rgba(fig, pad_inches=0.1)
+        plt.close(fig)
+
+        assert pixels.shape[2] == 4
+        assert pixels.shape[0] < 200 and pixels.shape[1] < 200
+        assert abs(pixels.shape[1] - bbox.width * 50) <= 1
+        assert abs(pixels.shape[0] - bbox.height * 50) <= 1
+
+    def test_render_tight_rgba_keeps_content_off_canvas(self):
+        """Test that text drawn above the canvas is kept in the pixels."""
+        fig = plt.figure(figsize=(4, 4), dpi=50)
+        fig.text(0.5, 1.1, "Title", ha="center", va="bottom")
+
+        pixels, bbox = render_tight_rgba(fig, pad_inches=0.1)
+        plt.close(fig)
+
+        assert pixels.shape[:2] == (int(bbox.height * 50), int(bbox.width * 50))
+        assert bbox.y1 > 4
+        assert (pixels[..., :3] < 128).any()
+
+
+class TestExportAllFormats:
+    """Test cases for MapExporter.export_all_formats."""
+
+    def test_export_all_formats_skips_unsupported(self, tmp_path, monkeypatch):
+        """Test sequential export of supported formats only."""
+        monkeypatch.setattr("src.export.exporters.os.cpu_count", lambda: 1)
+        fig, ax = plt.subplots()
+        ax.plot([0, 1], [0, 1])
+
+        paths = MapExporter(str(tmp_path)).export_all_formats(
+            fig, "map", ["png", "tiff", "PDF"]
+        )
+        plt.close(fig)
+
+        assert [os.path.basename(p) for p in paths] == ["map.png", "map.pdf"]
+        assert all(os.path.getsize(p) > 0 for p in paths)
+
+    def test_export_all_formats_in_processes(self, tmp_path, monkeypatch):
+        """Test that parallel export writes every format in order."""
+        monkeypatch.setattr("src.export.exporters.os.cpu_count", lambda: 2)
+        fig, ax = plt.subplots()
+        ax.plot([0, 1], [0, 1])
+
+        paths = MapExporter(str(tmp_path)).export_all_formats(
+            fig, "map", ["svg", "png"]
+        )
+        plt.close(fig)
+
+        assert [os.path.basename(p) for p in paths] == ["map.svg", "map.png"]
+        assert all(os.path.getsize(p) > 0 for p in paths)
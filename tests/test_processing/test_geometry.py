@@ -0,0 +1,107 @@
+"""Tests for geometry preprocessing."""
+
+import geopandas as gpd
+import pytest
+from shapely.geometry import LineString, Polygon
+
+from src.processing.geometry import (
+    merge_lines_by_key,
+    render_tolerance,
+    select_in_extent,
+    simplify_geometries,
+)
+
+
+class TestRenderTolerance:
+    """Test cases for render_tolerance."""
+
+    def test_render_tolerance_half_pixel(self):
+        """Test tolerance equals half the data width of one pixel."""
+        assert render_tolerance(65, 48, 300) == pytest.approx(65 / 14400 / 2)
+
+
+class TestSelectInExtent:
+    """Test cases for select_in_extent."""
+
+    def test_select_in_extent_keeps_intersecting_rows(self):
+        """Test that only geometries touching the extent are kept, in order."""
+        gdf = gpd.GeoDataFrame(
+            {"NAME": ["inside", "outside", "crossing"]},
+            geometry=[
+                LineString([(1, 1), (2, 2)]),
+                LineString([(20, 20), (21, 21)]),
+                LineString([(-5, 5), (5, 5)]),
+            ],
+            crs="EPSG:4326",
+        )
+
+        result = select_in_extent(gdf, (0, 0, 10, 10))
+
+        assert list(result["NAME"]) == ["inside", "crossing"]
+
+
+class TestSimplifyGeometries:
+    """Test cases for simplify_geometries."""
+
+    def test_simplify_geometries_drops_vertices(self):
+        """Test that collinear sub-tolerance vertices are removed."""
+        polygon = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]).segmentize(0.01)
+        gdf = gpd.GeoDataFrame(
+            {"NAME": ["County1"]}, geometry=[polygon], crs="EPSG:4326"
+        )
+
+        result = simplify_geometries(gdf, 0.001)
+
+        assert len(result.geometry.iloc[0].exterior.coords) == 5
+        assert result.crs == "EPSG:4326"
+        assert list(result["NAME"]) == ["County1"]
+
+    def test_simplify_geometries_keeps_input(self):
+        """Test that the input GeoDataFrame is left untouched."""
+        line = LineString([(0, 0), (0.5, 0.0001), (1, 0)])
+        gdf = gpd.GeoDataFrame(geometry=[line], crs="EPSG:4326")
+
+        result = simplify_geometries(gdf, 0.001)
+
+        assert len(result.geometry.iloc[0].coords) == 2
+        assert len(gdf.geometry.iloc[0].coords) == 3
+
+    def test_simplify_geometries_parallel_matches_serial(self):
+        """Test that chunked parallel simplification preserves order."""
+        lines = [
+            LineString([(i, 0), (i + 0.5, 0.0001), (i + 1, 0)]) for i in range(1500)
+        ]
+        gdf = gpd.GeoDataFrame(geometry=lines, crs="EPSG:4326")
+
+        serial = simplify_geometries(gdf, 0.001, n_jobs=1)
+        parallel = simplify_geometries(gdf, 0.001, n_jobs=4)
+
+        assert parallel.geometry.geom_equals(serial.geometry).all()
+
+
+class TestMergeLinesByKey:
+    """Test cases for merge_lines_by_key."""
+
+    def test_merge_lines_by_key_joins_touching_segments(self):
+        """Test that touching segments with the same key become one line."""
+        geometries = [
+            LineString([(0, 0), (1, 0)]),
+            LineString([(5, 5), (6, 6)]),
+            LineString([(1, 0), (2, 0)]),
+        ]
+
+        merged, keys = merge_lines_by_key(geometries, ["I- 10", "I- 5", "I- 10"])
+
+        assert list(keys) == ["I- 10", "I- 5"]
+        assert merged[0].equals(LineString([(0, 0), (1, 0), (2, 0)]))
+        assert merged[1].equals(LineString([(5, 5), (6, 6)]))
+
+    def test_merge_lines_by_key_keeps_disjoint_parts(self):
+        """Test that disjoint segments of one key stay separate parts."""
+        geometries = [LineString([(0, 0), (1, 0)]), LineString([(3, 0), (4, 0)])]
+
+        merged, keys = merge_lines_by_key(geometries, ["I- 10", "I- 10"])
+
+        assert len(keys) == 1
+        assert merged[0].geom_type == "MultiLineString"
+        assert len(merged[0].geoms) == 2
@@ -0,0 +1,64 @@
+"""Tests for greedy label placement."""
+
+import pytest
+
+from src.processing.labels import LabelPlacer, text_box_size
+
+
+class TestTextBoxSize:
+    """Test cases for text_box_size."""
+
+    def test_text_box_size_rotated(self):
+        """Test that a quarter turn swaps width and height."""
+        width, height = text_box_size("I- 10", 10)
+        rotated_width, rotated_height = text_box_size("I- 10", 10, rotation=90)
+
+        assert width == pytest.approx(30)
+        assert height == pytest.approx(12)
+        assert rotated_width == pytest.approx(height)
+        assert rotated_height == pytest.approx(width)
+
+    def test_text_box_size_multiline(self):
+        """Test that the longest line sets the width."""
+        width, height = text_box_size("ab\nabcd", 10, pad=0.5)
+
+        assert width == pytest.approx(34)
+        assert height == pytest.approx(34)
+
+
+class TestLabelPlacer:
+    """Test cases for LabelPlacer."""
+
+    def test_place_centers_first_label(self):
+        """Test that a label with free space is centered on its anchor."""
+        placer = LabelPlacer((0, 0, 100, 100), shape=(100, 100))
+
+        assert placer.place(50, 50, 20, 10) == (50, 50)
+
+    def test_place_shifts_around_occupied_space(self):
+        """Test that an overlapping label moves to a free neighbor position."""
+        placer = LabelPlacer((0, 0, 100, 100), shape=(100, 100))
+        placer.place(50, 50, 20, 10)
+
+        assert placer.place(62, 50, 20, 10) == (72, 50)
+
+    def test_place_with_fixed_offset_skips_instead_of_moving(self):
+        """Test that a single allowed offset either fits or is rejected."""
+        placer = LabelPlacer((0, 0, 100, 100), shape=(100, 100))
+
+        assert placer.place(40, 40, 20, 10, offsets=[(1, 1)]) == (50, 45)
+        assert placer.place(45, 40, 20, 10, offsets=[(1, 1)]) is None
+
+    def test_place_rejects_blocked_label(self):
+        """Test that a label with no free position is skipped."""
+        placer = LabelPlacer((0, 0, 100, 100), shape=(100, 100))
+        placer.claim(50, 50, 100, 100)
+
+        assert placer.place(50, 50, 20, 10) is None
+
+    def test_place_rejects_label_outside_extent(self):
+        """Test that positions reaching outside the extent are not used."""
+        placer = LabelPlacer((0, 0, 100, 100), shape=(100, 100))
+
+        assert placer.place(0, 0, 20, 10) == (10, 5)
+        assert placer.place(-50, -50, 20, 10) is None
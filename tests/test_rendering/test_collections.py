@@ -0,0 +1,79 @@
+"""Tests for building matplotlib collections from geometries."""
+
+import numpy as np
+import pytest
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.path import Path
+from shapely.geometry import LineString, MultiLineString, MultiPolygon, Polygon
+
+from src.rendering.collections import build_line_collection, build_polygon_collection
+
+
+class TestBuildLineCollection:
+    """Test cases for build_line_collection."""
+
+    def test_build_line_collection_segments(self):
+        """Test that each line part becomes one segment."""
+        geometries = [
+            LineString([(0, 0), (1, 1)]),
+            MultiLineString([[(2, 2), (3, 3), (4, 4)], [(5, 5), (6, 6)]]),
+        ]
+
+        result = build_line_collection(geometries, colors="#404040")
+
+        assert isinstance(result, LineCollection)
+        segments = result.get_segments()
+        assert len(segments) == 3
+        np.testing.assert_allclose(segments[1], [[2, 2], [3, 3], [4, 4]])
+
+    def test_build_line_collection_skips_empty(self):
+        """Test that empty geometries produce no segments."""
+        geometries = [LineString(), LineString([(0, 0), (1, 0)])]
+
+        result = build_line_collection(geometries)
+
+        assert len(result.get_segments()) == 1
+
+    def test_build_line_collection_geometry_colors(self):
+        """Test that per-geometry colors are repeated for each line part."""
+        geometries = [
+            LineString(),
+            MultiLineString([[(0, 0), (1, 1)], [(2, 2), (3, 3)]]),
+            LineString([(4, 4), (5, 5)]),
+        ]
+
+        result = build_line_collection(
+            geometries, geometry_colors=["red", "blue", "green"]
+        )
+
+        colors = result.get_colors()
+        assert len(colors) == 3
+        np.testing.assert_allclose(colors[0], [0, 0, 1, 1])
+        np.testing.assert_allclose(colors[1], [0, 0, 1, 1])
+        np.testing.assert_allclose(colors[2], [0, 0.5019608, 0, 1])
+
+
+class TestBuildPolygonCollection:
+    """Test cases for build_polygon_collection."""
+
+    def test_build_polygon_collection_one_path_per_geometry(self):
+        """Test that polygons and multipolygons map to one path each."""
+        square = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+        holed = Polygon(
+            [(0, 0), (4, 0), (4, 4), (0, 4)], [[(1, 1), (1, 2), (2, 2), (2, 1)]]
+        )
+        multi = MultiPolygon([square, Polygon([(5, 5), (6, 5), (6, 6)])])
+
+        result = build_polygon_collection([square, holed, multi])
+
+        assert isinstance(result, PathCollection)
+        paths = result.get_paths()
+        assert len(paths) == 3
+        assert len(paths[0].vertices) == 5
+        assert list(paths[1].codes).count(Path.MOVETO) == 2
+        assert list(paths[2].codes).count(Path.CLOSEPOLY) == 2
+
+    def test_build_polygon_collection_rejects_lines(self):
+        """Test that non-polygon input raises ValueError."""
+        with pytest.raises(ValueError, match="Expected polygon geometries"):
+            build_polygon_collection([LineString([(0, 0), (1, 1)])])
@@ -0,0 +1,36 @@
+"""Tests for color helpers."""
+
+import numpy as np
+
+from src.rendering.colors import blend_alpha, palette_indices
+
+
+class TestBlendAlpha:
+    """Test cases for blend_alpha."""
+
+    def test_blend_alpha_over_white(self):
+        """Test compositing black at half opacity over white gives grey."""
+        result = blend_alpha(["#000000"], 0.5)
+
+        np.testing.assert_allclose(result, [[0.5, 0.5, 0.5, 1.0]])
+
+    def test_blend_alpha_over_background(self):
+        """Test compositing over a custom background color."""
+        result = blend_alpha(["#FFFFFF", "#000000"], 0.8, background="#000000")
+
+        np.testing.assert_allclose(result[:, 0], [0.8, 0.0])
+        assert (result[:, 3] == 1.0).all()
+
+
+class TestPaletteIndices:
+    """Test cases for palette_indices."""
+
+    def test_palette_indices_stable_per_key(self):
+        """Test that equal keys get equal indices within the palette range."""
+        result = palette_indices(["06037", "06059", "06037"], 8)
+
+        assert result[0] == result[2]
+        assert ((result >= 0) & (result < 8)).all()
+        np.testing.assert_array_equal(
+            result, palette_indices(["06037", "06059", "06037"], 8)
+        )
@@ -0,0 +1,182 @@
+"""Tests for the US map renderer."""
+
+import geopandas as gpd
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
+from shapely.geometry import LineString, MultiLineString, Point, Polygon
+
+from src.rendering.map_renderer import USMapRenderer
+from src.utils.config import COUNTY_COLORS
+
+
+class TestRenderMasjids:
+    """Test cases for USMapRenderer.render_masjids."""
+
+    def test_render_masjids_one_collection_and_text_per_masjid(self):
+        """Test that points share one artist and each masjid gets a text label."""
+        masjids = gpd.GeoDataFrame(
+            {"name": ["Masjid A", "Masjid B"]},
+            geometry=[Point(-118.2, 34.0), Point(-84.5, 39.1)],
+            crs="EPSG:4326",
+        )
+        renderer = USMapRenderer(dpi=10)
+        renderer.create_figure()
+
+        renderer.render_masjids(masjids)
+        collections, texts = renderer.ax.collections, renderer.ax.texts
+        renderer.close()
+
+        assert len(collections) == 1
+        assert len(collections[0].get_offsets()) == 2
+        assert [text.get_text() for text in texts] == ["Masjid A", "Masjid B"]
+
+    def test_render_masjids_skips_overlapping_labels(self):
+        """Test that a label overlapping an earlier one is not drawn."""
+        masjids = gpd.GeoDataFrame(
+            {"name": ["Masjid A", "Masjid B", "Masjid C"]},
+            geometry=[Point(-118.2, 34.0), Point(-118.2, 34.0), Point(-84.5, 39.1)],
+            crs="EPSG:4326",
+        )
+        renderer = USMapRenderer(dpi=10)
+        renderer.create_figure()
+
+        renderer.render_masjids(masjids)
+        texts = renderer.ax.texts
+        renderer.close()
+
+        assert [text.get_text() for text in texts] == ["Masjid A", "Masjid C"]
+
+
+class TestRenderCounties:
+    """Test cases for USMapRenderer.render_counties."""
+
+    def test_render_counties_uses_palette_colors(self):
+        """Test that every county is filled with a palette color."""
+        squares = [Polygon([(i, 0), (i + 1, 0), (i + 1, 1), (i, 1)]) for i in range(20)]
+        counties = gpd.GeoDataFrame(geometry=squares, crs="EPSG:4326")
+        renderer = USMapRenderer(dpi=10)
+        renderer.create_figure()
+
+        renderer.render_counties(counties)
+        renderer.fig.canvas.draw()
+        facecolors = renderer.ax.collections[0].get_facecolors()
+        renderer.close()
+
+        palette = to_rgba_array(COUNTY_COLORS)[:, :3]
+        assert len(facecolors) == 20
+        assert all(
+            np.isclose(palette, rgba[:3]).all(axis=1).any() for rgba in facecolors
+        )
+
+    def test_render_counties_rasterized(self):
+        """Test that counties are rasterized in vector exports."""
+        counties = gpd.GeoDataFrame(
+            geometry=[Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])], crs="EPSG:4326"
+        )
+        renderer = USMapRenderer(dpi=10)
+        renderer.create_figure()
+
+        renderer.render_counties(counties)
+        rasterized = renderer.ax.collections[0].get_rasterized()
+        renderer.close()
+
+        assert rasterized
+
+
+class TestRenderHighways:
+    """Test cases for USMapRenderer.render_highways."""
+
+    def test_render_highways_single_line_collection(self):
+        """Test that all highway parts are drawn by one LineCollection."""
+        highways = gpd.GeoDataFrame(
+            geometry=[
+                LineString([(0, 0), (1, 1)]),
+                MultiLineString([[(2, 2), (3, 3)], [(4, 4), (5, 5)]]),
+            ],
+            crs="EPSG:4326",
+        )
+        renderer = USMapRenderer(dpi=10)
+        renderer.create_figure()
+
+        renderer.render_highways(highways)
+        collections = renderer.ax.collections
+        renderer.close()
+
+        assert len(collections) == 1
+        assert isinstance(collections[0], LineCollection)
+        assert len(collections[0].get_segments()) == 3
+
+
+class TestRenderCompleteMap:
+    """Test cases for USMapRenderer.render_complete_map."""
+
+    def test_render_complete_map_skips_highways_outside_extent(self):
+        """Test that only highways crossing the county extent are drawn."""
+        counties = gpd.GeoDataFrame(
+            geometry=[Polygon([(-118, 33), (-117, 33), (-117, 34), (-118, 34)])],
+            crs="EPSG:4326",
+        )
+        highways = gpd.GeoDataFrame(
+            geometry=[
+                LineString([(-119, 33.5), (-116, 33.5)]),
+                LineString([(-80, 40), (-79, 40)]),
+            ],
+            crs="EPSG:4326",
+        )
+        masjids = gpd.GeoDataFrame(
+            {"name": ["Masjid A"]}, geometry=[Point(-117.5, 33.5)], crs="EPSG:4326"
+        )
+        renderer = USMapRenderer(dpi=10)
+
+        fig, ax = renderer.render_complete_map(counties, highways, masjids)
+        highway_paths = ax.collections[1].get_paths()
+        renderer.close()
+
+        assert len(highway_paths) == 1
+
+    def test_render_complete_map_reuses_figure(self):
+        """Test that a second render clears and reuses the open figure."""
+        counties = gpd.GeoDataFrame(
+            geometry=[Polygon([(-118, 33), (-117, 33), (-117, 34), (-118, 34)])],
+            crs="EPSG:4326",
+        )
+        highways = gpd.GeoDataFrame(
+            geometry=[LineString([(-119, 33.5), (-116, 33.5)])], crs="EPSG:4326"
+        )
+        masjids = gpd.GeoDataFrame(
+            {"name": ["Masjid A"]}, geometry=[Point(-117.5, 33.5)], crs="EPSG:4326"
+        )
+        renderer = USMapRenderer(dpi=10)
+
+        first_fig, _ = renderer.render_complete_map(counties, highways, masjids)
+        second_fig, ax = renderer.render_complete_map(counties, highways, masjids)
+        n_collections, n_texts = len(ax.collections), len(ax.texts)
+        renderer.close()
+
+        assert second_fig is first_fig
+        assert n_collections == 3
+        assert n_texts == 1
+
+    def test_render_complete_map_title_inside_figure(self):
+        """Test that the title stays on the canvas for a tall extent."""
+        counties = gpd.GeoDataFrame(
+            geometry=[Polygon([(0, 0), (1, 0), (1, 10), (0, 10)])], crs="EPSG:4326"
+        )
+        highways = gpd.GeoDataFrame(
+            geometry=[LineString([(0, 0), (1, 1)])], crs="EPSG:4326"
+        )
+        masjids = gpd.GeoDataFrame(
+            {"name": ["Masjid A"]}, geometry=[Point(0.5, 5)], crs="EPSG:4326"
+        )
+        renderer = USMapRenderer(dpi=10)
+
+        fig, ax = renderer.render_complete_map(
+            counties, highways, masjids, title="Title"
+        )
+        fig.canvas.draw()
+        title_top = ax.title.get_window_extent().y1
+        figure_top = fig.bbox.y1
+        renderer.close()
+
+        assert title_top <= figure_top